@@ -3,43 +3,47 @@
 from __future__ import annotations
 
 import sys
-import importlib.metadata
 
 if (sys.version_info.major, sys.version_info.minor) < (3, 9):
     print("Python 3.9 or higher is needed", file=sys.stderr)
     sys.exit(-1)
 
 if len(sys.argv) >= 2 and (sys.argv[1] == "--version" or sys.argv[1] == "-v"):
+    import importlib.metadata
     print(importlib.metadata.version("risset"))
     sys.exit(0)
 
-import glob
+import atexit
+import io
 import os
 import stat
-import argparse
 import json
-import tempfile
 import shutil
 import subprocess
-import textwrap
-import fnmatch
-import pprint
+import functools
+import threading
 import platform
-from dataclasses import dataclass, asdict as _asdict
+from dataclasses import dataclass, field, asdict as _asdict
 
-import requests
-import urllib.parse
-import urllib.request
-import urllib.error
 from pathlib import Path
-from zipfile import ZipFile
-import inspect as _inspect
 import re
 from string import Template as _Template
 
+try:
+    # orjson's JSONDecodeError is a subclass of json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Callable, Iterable, TextIO
+    from zipfile import ZipFile, ZipInfo
+    import argparse
+
+
+# Classes instantiated in large numbers use slots where supported (python >= 3.10)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class PlatformNotSupportedError(Exception):
@@ -54,13 +58,20 @@ class ParseError(Exception):
     """Parse error in a manifest file"""
 
 
-def _subproc_call(args: list[str] | str, shell: bool | None = None):
+def _subproc_call(args: list[str] | str, shell: bool | None = None, cwd: str | Path | None = None):
     if shell is None:
         shell = isinstance(args, str)
-    _debug(f"Calling subprocess with shell={shell}: {args}")
-    return subprocess.call(args, shell=shell)
+    _debug("Calling subprocess, shell:", shell, "args:", args)
+    return subprocess.call(args, shell=shell, cwd=cwd)
+
 
+def _risset_version() -> str:
+    """The version of risset itself, as installed"""
+    import importlib.metadata
+    return importlib.metadata.version("risset")
 
+
+@functools.lru_cache(maxsize=None)
 def _data_dir_for_platform() -> Path:
     """
     Returns the data directory for the given platform
@@ -85,8 +96,20 @@ RISSET_CLONES_PATH = RISSET_ROOT / "clones"
 RISSET_ASSETS_PATH = RISSET_ROOT / "assets"
 RISSET_OPCODESXML = RISSET_ROOT / "opcodes.xml"
 _MAININDEX_PICKLE_FILE = RISSET_ROOT / "mainindex.pickle"
+_DLLS_CACHE_FILE = RISSET_ROOT / ".dlls_cache.pickle"
+_PLUGINS_CACHE_FILE = RISSET_ROOT / ".plugins_cache.pickle"
+_MANPAGES_CACHE_FILE = RISSET_ROOT / ".manpages_cache.pickle"
+_DOWNLOADS_CACHE_FILE = RISSET_ROOT / ".downloads_cache.pickle"
 MACOS_ENTITLEMENTS_PATH = RISSET_ASSETS_PATH / 'csoundplugins.entitlements'
 
+# Written at the start of the main index pickle file. Change the version
+# number whenever the layout of MainIndex changes, to discard older files
+_MAININDEX_PICKLE_HEADER = b"RISSETI3"
+
+# Depth used for cloning and updating the index and plugin repositories.
+# Only the latest revision is needed. Set RISSET_FULL_HISTORY to use full clones
+_GIT_DEPTH = 0 if os.environ.get("RISSET_FULL_HISTORY") else 1
+
 UNKNOWN_VERSION = "Unknown"
 
 
@@ -119,20 +142,31 @@ _entitlements_str = r"""
 
 
 def _macos_save_entitlements() -> Path:
-    path = MACOS_ENTITLEMENTS_PATH
-    _ensure_parent_exists(path)
-    if not _session.entitlements_saved:
-        with open(path, 'w') as f:
-            f.write(_entitlements_str)
-        assert os.path.exists(path)
-        plutil = shutil.which('plutil')
-        if plutil:
-            _debug(f"Verifying that the entitlements file '{path}' is a valid plist")
-            _subproc_call([plutil, path])
-        _session.entitlements_saved = True
-        _debug(f"Saved entitlements file to {path}")
-        _debug(f"Entitlements:\n{open(path).read()}\n------------ end entitlements")
+    """
+    Save the entitlements file, if needed, and return its path
 
+    The file is only rewritten if its contents differ from the
+    entitlements. The write is atomic, so a concurrent process never
+    sees a partially written file
+    """
+    path = MACOS_ENTITLEMENTS_PATH
+    if _session.entitlements_saved:
+        return path
+    try:
+        uptodate = path.read_text() == _entitlements_str
+    except OSError:
+        uptodate = False
+    if uptodate:
+        _debug("Entitlements file is up to date:", path)
+    else:
+        _ensure_parent_exists(path)
+        tmppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmppath.write_text(_entitlements_str)
+        os.replace(tmppath, path)
+        if _session.debug:
+            _debug(f"Saved entitlements file to {path}")
+            _debug(f"Entitlements:\n{_entitlements_str}\n------------ end entitlements")
+    _session.entitlements_saved = True
     return path
 
 # SIGNATURE_ID="-"
@@ -151,10 +185,13 @@ def macos_codesign(dylibpaths: list[str], signature='-') -> None:
         raise RuntimeError("Could not find the binary 'codesign' in the path")
     entitlements_path = _macos_save_entitlements()
     assert os.path.exists(entitlements_path)
-    for dylibpath in dylibpaths:
-        _subproc_call(['codesign', '--force', '--sign', signature, '--entitlements', entitlements_path, dylibpath])
+    if not dylibpaths:
+        return
+    # codesign accepts multiple paths, sign them all with one call
+    _subproc_call(['codesign', '--force', '--sign', signature, '--entitlements', entitlements_path, *dylibpaths])
+    if _session.debug:
         _debug("Verifying code signing")
-        _subproc_call(['codesign', '--display', '--verbose', dylibpath])
+        _subproc_call(['codesign', '--display', '--verbose', *dylibpaths])
 
 
 def _normalize_platform(s: str) -> str:
@@ -185,6 +222,7 @@ def _normalize_platform(s: str) -> str:
     return s if s in _supported_platforms else ''
 
 
+@functools.lru_cache(maxsize=None)
 def _platform_architecture() -> str:
     """
     Returns the architecture for this platform
@@ -212,6 +250,7 @@ def _platform_architecture() -> str:
     raise RuntimeError(f"** Architecture not supported (machine='{machine}', {bits=}, {linkage=})")
 
 
+@functools.lru_cache(maxsize=None)
 def _csoundlib_version() -> tuple[int, int]:
     """Returns a tuple (major, minor) using the csound api
 
@@ -224,6 +263,9 @@ def _csoundlib_version() -> tuple[int, int]:
     return major, minor
 
 
+_RE_CSOUND_VERSION = re.compile(r'--Csound\s+version\s+(\d+)\.(\d+)(.*)')
+
+
 def _csound_version(csoundexe='csound') -> tuple[int, int, str]:
     """
     Query the csound version via the executable
@@ -237,77 +279,203 @@ def _csound_version(csoundexe='csound') -> tuple[int, int, str]:
     csound_bin = _get_csound_binary(csoundexe)
     if not csound_bin:
         raise OSError("csound binary not found")
-    proc = subprocess.Popen([csound_bin, "--version"], stderr=subprocess.PIPE)
-    proc.wait()
-    assert proc.stderr is not None
-    out = proc.stderr.read().decode('ascii')
-    for line in out.splitlines():
-        if match := re.search(r'--Csound\s+version\s+(\d+)\.(\d+)(.*)', line):
+    key = ('csound-version', csound_bin, os.stat(csound_bin).st_mtime_ns)
+    if (out := _session.cache.get(key)) is not None:
+        return out
+    # csound prints its version to stderr
+    proc = subprocess.run([csound_bin, "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          encoding='ascii', errors='replace')
+    for line in proc.stderr.splitlines():
+        if match := _RE_CSOUND_VERSION.search(line):
             major = int(match.group(1))
             minor = int(match.group(2))
             rest = match.group(3)
-            return major, minor, rest
+            _session.cache[key] = out = (major, minor, rest)
+            return out
     raise ValueError("Could not find a version number in the output")
 
 
-class _Session:
+# Bump this whenever the structure of the persistent caches changes
+_PERSISTENT_CACHE_FORMAT = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _persistent_cache_layout() -> tuple:
+    """
+    Identifies the layout of the objects stored in the persistent caches
+
+    Objects pickled by a version of risset with other fields (a new slot,
+    for example) would unpickle without error but be unusable, so the
+    fields of every cached dataclass are part of the layout
+    """
+    from dataclasses import fields
+    classes = (Plugin, Binary, Asset, ManPage, IndexItem)
+    return (_PERSISTENT_CACHE_FORMAT,
+            tuple((cls.__name__, tuple(f.name for f in fields(cls))) for cls in classes))
+
+
+class _PersistentCache:
     """
-    Simgleton class to hold information about the session
+    A dict which persists across sessions as a pickle file
 
-    This class keeps track of downloaded files, cloned repos, etc.
+    The file is loaded lazily at first access and, if the cache was
+    modified, saved once at exit. A file saved with a different layout
+    (see _persistent_cache_layout) is discarded
+
+    Args:
+        path: the path of the pickle file
     """
-    instance: _Session | None = None
+    def __init__(self, path: Path):
+        self.path = path
+        self._data: dict | None = None
+        self._modified = False
+
+    def data(self) -> dict:
+        if self._data is None:
+            self._data = {}
+            if self.path.exists():
+                import pickle
+                try:
+                    with open(self.path, 'rb') as f:
+                        stored = pickle.load(f)
+                    if (isinstance(stored, tuple) and len(stored) == 2
+                            and stored[0] == _persistent_cache_layout()):
+                        self._data = stored[1]
+                    else:
+                        _debug(f"Cache {self.path} has an outdated layout, discarding it")
+                except Exception as e:
+                    _debug(f"Could not load cache from {self.path}: {e}")
+        return self._data
+
+    def get(self, key: str):
+        return self.data().get(key)
 
-    def __new__(cls, *args, **kwargs):
-        if _Session.instance is not None:
-            return _Session.instance
+    def set(self, key: str, value) -> None:
+        self.data()[key] = value
+        self._set_modified()
 
-        instance = super().__new__(cls, *args, **kwargs)
-        _Session.instance = instance
-        return instance
+    def invalidate(self, key: str) -> None:
+        if self.data().pop(key, None) is not None:
+            self._set_modified()
 
+    def _set_modified(self) -> None:
+        if not self._modified:
+            self._modified = True
+            atexit.register(self.save)
+
+    def save(self) -> None:
+        """
+        Save the cache to disk, if it was modified
+        """
+        if not self._modified or self._data is None:
+            return
+        import pickle
+        try:
+            _ensure_parent_exists(self.path)
+            with open(self.path, 'wb') as f:
+                pickle.dump((_persistent_cache_layout(), self._data), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            self._modified = False
+        except Exception as e:
+            _debug(f"Could not save cache to {self.path}: {e}")
+
+
+class _Session:
+    """
+    Holds information about the session
+
+    This class keeps track of downloaded files, cloned repos, etc. It is
+    instantiated only once, as the module-level ``_session``
+    """
     def __init__(self):
         self.downloaded_files: dict[str, Path] = {}
         self.cloned_repos: dict[str, Path] = {}
+        self.fresh_clones: set[Path] = set()
+        """Repositories cloned during this session, these do not need to be updated"""
+
+        self.updated_repos: set[Path] = set()
+        """Repositories already updated during this session"""
+
+        self.clone_locks: dict[Path, threading.Lock] = {}
+        """A lock for each clone destination, see clone_lock"""
+        self._clone_locks_guard = threading.Lock()
+
         self.platform: str = {
             'linux': 'linux',
             'darwin': 'macos',
             'win32': 'windows'
         }[sys.platform]
 
-        self.architecture = _platform_architecture()
-        """The current architecture"""
+        self.debug = bool(os.environ.get("RISSET_DEBUG"))
+        """True if in debug mode. Can be enabled via the RISSET_DEBUG env variable"""
+
+        self.stop_on_errors = True
+        self.entitlements_saved = False
+        self.cache = {}
+
+        self.dlls_cache = _PersistentCache(_DLLS_CACHE_FILE)
+        """Maps a plugins folder to a tuple (mtime_ns, plugin filenames)"""
+
+        self.plugins_cache = _PersistentCache(_PLUGINS_CACHE_FILE)
+        """Maps a plugin name to a tuple (manifest path, mtime_ns, Plugin)"""
+
+        self.manpages_cache = _PersistentCache(_MANPAGES_CACHE_FILE)
+        """Maps opcode:manpath to a tuple (mtime_ns, size, ManPage)"""
 
-        self.platformid = self._platform_id()
-        """The pair <os>-<arch> (linux-x86_64, windows-x86_64, macos-arm64, etc"""
+        self.downloads_cache = _PersistentCache(_DOWNLOADS_CACHE_FILE)
+        """Maps a url to a tuple (path, mtime_ns, validators), where validators holds
+        the ETag / Last-Modified headers of the response"""
 
-        major, minor = _csoundlib_version()
+    # The properties below are computed on first access, since they involve
+    # querying the system or loading the csound library
 
-        self.debug = False
-        """True if in debug mode"""
+    @functools.cached_property
+    def architecture(self) -> str:
+        """The current architecture"""
+        return _platform_architecture()
+
+    @functools.cached_property
+    def platformid(self) -> str:
+        """
+        The pair <os>-<arch> (linux-x86_64, windows-x86_64, macos-arm64, etc)
+        """
+        return f'{self.platform}-{self.architecture}'
 
-        self.csound_version_tuple = (major, minor)
+    @functools.cached_property
+    def csound_version_tuple(self) -> tuple[int, int]:
         """Csound version as (major, minor)"""
+        return _csoundlib_version()
 
-        self.csound_version: int = major * 1000 + minor * 10
+    @functools.cached_property
+    def csound_version(self) -> int:
         """Csound version id as integer, 6190 = 6.19, 7000 = 7.0"""
+        major, minor = self.csound_version_tuple
+        return major * 1000 + minor * 10
 
-        self.stop_on_errors = True
-        self.entitlements_saved = False
-        self.cache = {}
+    @functools.cached_property
+    def http(self):
+        """A requests.Session, to reuse connections across downloads"""
+        import requests
+        return requests.Session()
 
-    def _platform_id(self) -> str:
+
+    def clone_lock(self, destination: Path) -> threading.Lock:
         """
-        Returns one of 'linux', 'windows', 'macos' (intel x86_64) or their 'arm64' variant:
-        'macos-arm64', 'linux-arm64', etc.
+        The lock serializing the cloning of repositories into destination
+
+        Different urls can share a repository name and thus a clone destination
         """
-        return f'{self.platform}-{self.architecture}'
+        with self._clone_locks_guard:
+            lock = self.clone_locks.get(destination)
+            if lock is None:
+                self.clone_locks[destination] = lock = threading.Lock()
+            return lock
 
 
 _session = _Session()
 
 
-@dataclass
+@dataclass(frozen=True)
 class _VersionRange:
     minversion: int
     maxversion: int
@@ -357,6 +525,7 @@ def _termsize(width=80, height=25) -> tuple[int, int]:
         return width, height
 
 
+@functools.lru_cache(maxsize=None)
 def _version_to_versionid(versionstr: str) -> int:
     if '.' not in versionstr:
         return int(versionstr)
@@ -370,6 +539,10 @@ def _version_to_versionid(versionstr: str) -> int:
     return versionid
 
 
+_RE_VERSION_OPERATOR = re.compile(r"(>=|<=|>|<)")
+
+
+@functools.lru_cache(maxsize=None)
 def _parse_version(versionstr: str) -> _VersionRange:
     versionstr = versionstr.replace(' ', '')
     if versionstr.startswith("=="):
@@ -377,7 +550,7 @@ def _parse_version(versionstr: str) -> _VersionRange:
         versionid = _version_to_versionid(exactversionstr)
         return _VersionRange(minversion=versionid, maxversion=versionid, includemin=True, includemax=True)
 
-    parts = re.split(r"(>=|<=|>|<)", versionstr)
+    parts = _RE_VERSION_OPERATOR.split(versionstr)
     parts = [p for p in parts if p]
     if len(parts) % 2 != 0:
         raise ParseError(f"Could not parse version range: {versionstr}, parts: {parts}")
@@ -413,19 +586,60 @@ def _abbrev(s: str, maxlen: int) -> str:
 def _mainindex_retrieve(days_threshold=10) -> MainIndex | None:
     """
     Try to retrieve a previously pickled mainindex
+
+    The loaded index is kept in memory, keyed on the modification time of
+    the pickle file, so that repeated calls within the same process do not
+    load it again. A pickle older than the json index it was created from
+    is not used.
     """
     picklefile = _MAININDEX_PICKLE_FILE
-    if not picklefile.exists():
+    try:
+        picklestat = picklefile.stat()
+    except FileNotFoundError:
         return None
     import time
     import pickle
-    days_since_last_modification = (picklefile.stat().st_mtime - time.time()) / 86400
+    days_since_last_modification = (time.time() - picklestat.st_mtime) / 86400
     if days_since_last_modification > days_threshold:
+        _debug(f"Serialized main index is older than {days_threshold} days, discarding it")
+        return None
+    if picklestat.st_size <= len(_MAININDEX_PICKLE_HEADER):
+        _debug("Serialized main index is empty, discarding it")
+        return None
+    indexfile = RISSET_DATAREPO_LOCALPATH / "rissetindex.json"
+    if indexfile.exists() and indexfile.stat().st_mtime_ns > picklestat.st_mtime_ns:
+        _debug("The main index was modified after being serialized, discarding the serialized version")
         return None
+    cached = _session.cache.get('mainindex')
+    if cached is not None and cached[0] == picklestat.st_mtime_ns:
+        return cached[1]
     _debug("Recreating main index from pickled version")
-    f = open(picklefile, "rb")
+    import mmap
     try:
-        return pickle.load(f)
+        # Unpickle directly from the mapped file, avoiding buffered reads
+        with open(picklefile, "rb") as f:
+            if f.read(len(_MAININDEX_PICKLE_HEADER)) != _MAININDEX_PICKLE_HEADER:
+                _debug("Serialized main index has an unknown format, discarding it")
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The views need to be released before the map is closed
+                with memoryview(mm) as view, view[len(_MAININDEX_PICKLE_HEADER):] as data:
+                    mainindex = pickle.loads(data)
+        # Index files written by older versions may hold parsed manpages. These are
+        # always taken from _manpage_parse_cached, which checks them against the docs
+        mainindex._cache.pop('manpages', None)
+        if getattr(mainindex, '_manifests_state', None) != mainindex._manifests_with_mtimes():
+            # Plugins were installed / removed since the index was serialized
+            _debug("Installed manifests changed, discarding cached data")
+            mainindex._cache.clear()
+        if getattr(mainindex, '_plugin_manifests_state', None) != mainindex._plugin_manifests_with_mtimes():
+            # Some plugin definition was modified. Plugins are parsed again on
+            # demand, unmodified definitions are taken from the plugins cache
+            _debug("Plugin manifests changed, discarding the parsed plugins")
+            mainindex.__dict__.pop('plugins', None)
+            mainindex._cache.clear()
+        _session.cache['mainindex'] = (picklestat.st_mtime_ns, mainindex)
+        return mainindex
     except Exception as e:
         _errormsg(f"Could not retrieve mainindex from serialized file: {e}")
         _debug(f"Serialized file ({picklefile}) removed")
@@ -461,6 +675,7 @@ def _git_reponame(url: str) -> str:
     return parts[-1].rsplit(".", maxsplit=1)[0]
 
 
+@functools.lru_cache(maxsize=256)
 def _is_git_url(url: str) -> bool:
     """
     Is `url` an url to a git repo?
@@ -469,9 +684,15 @@ def _is_git_url(url: str) -> bool:
 
 
 def _debug(*msgs, ljust=20) -> None:
-    """ Print debug info only if debugging is turned on """
+    """
+    Print debug info only if debugging is turned on
+
+    Messages are converted to str only when printed, so passing objects
+    as separate arguments instead of formatting them beforehand costs
+    nothing when debugging is off
+    """
     if _session.debug:
-        caller = _abbrev(_inspect.stack()[1][3], ljust)
+        caller = _abbrev(sys._getframe(1).f_code.co_name, ljust)
         print(f"DEBUG:{caller.ljust(ljust)}:", *msgs, file=sys.stderr)
 
 
@@ -491,7 +712,63 @@ class ErrorMsg(str):
     pass
 
 
-@dataclass
+# Fields used only to memoize computed values, left out of Plugin.asdict
+_MEMO_FIELDS = frozenset(('_binary_filename', '_found_binaries', '_binaries_by_platform'))
+
+
+def _dict_without_memo_fields(items: list[tuple[str, Any]]) -> dict:
+    """
+    dict_factory for dataclasses.asdict, leaves out memoization fields
+    """
+    return {key: value for key, value in items if key not in _MEMO_FIELDS}
+
+
+# The characters which make glob treat a pattern as a wildcard, as glob.has_magic
+_RE_GLOB_MAGIC = re.compile(r'[*?[]')
+
+
+def _collect_matching_files(root: Path, patterns: list[str]) -> list[Path]:
+    """
+    Collect the files within root matching the given patterns
+
+    This is equivalent to calling glob for each pattern, but each folder
+    is listed only once and paths without wildcards are checked directly
+
+    Args:
+        root: the root folder
+        patterns: paths relative to root, either plain paths or glob patterns
+
+    Returns:
+        the matched paths, in the order given by the patterns
+    """
+    import fnmatch
+    collected: list[Path] = []
+    listings: dict[str, list[str]] = {}
+    for pattern in patterns:
+        folder, namepattern = os.path.split(pattern)
+        if not _RE_GLOB_MAGIC.search(pattern):
+            path = root / pattern
+            if os.path.lexists(path):
+                collected.append(path)
+        elif _RE_GLOB_MAGIC.search(folder):
+            import glob
+            collected.extend(Path(m) for m in glob.glob((root / pattern).as_posix()))
+        else:
+            names = listings.get(folder)
+            if names is None:
+                try:
+                    names = os.listdir(root / folder)
+                except OSError:
+                    names = []
+                listings[folder] = names
+            if not namepattern.startswith('.'):
+                # As glob, wildcards do not match hidden files
+                names = [name for name in names if not name.startswith('.')]
+            collected.extend(root / folder / name for name in fnmatch.filter(names, namepattern))
+    return collected
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Asset:
     """
     An Asset describes any file/files distributed alongside a plugin
@@ -561,12 +838,8 @@ class Asset:
         root = self.local_path()
         if root.is_dir():
             assert _is_git_repo(root)
-            _git_update(root)
-            collected_assets: list[Path] = []
-            for pattern in self.patterns:
-                matchedfiles = glob.glob((root/pattern).as_posix())
-                collected_assets.extend(Path(m) for m in matchedfiles)
-            return collected_assets
+            _git_update_many([root])
+            return _collect_matching_files(root, self.patterns)
         elif root.suffix == '.zip':
             _debug(f"Extracting {self.patterns} from {root}")
             outfiles = _zip_extract(root, self.patterns)
@@ -577,7 +850,7 @@ class Asset:
             return [root]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Binary:
     """
     A Binary describes a plugin binary
@@ -618,6 +891,8 @@ class Binary:
 
     _csound_version_range: _VersionRange | None = None
 
+    _binary_filename: str = field(default='', init=False, repr=False, compare=False)
+
     def __post_init__(self):
         platform = _normalize_platform(self.platform)
         if not platform:
@@ -643,20 +918,22 @@ class Binary:
         """
         The filename of the binary
         """
-        if not self.url.endswith('.zip'):
-            return os.path.split(self.url)[1]
-        else:
-            assert self.extractpath
-            return os.path.split(self.extractpath)[1]
+        if not self._binary_filename:
+            if not self.url.endswith('.zip'):
+                self._binary_filename = os.path.split(self.url)[1]
+            else:
+                assert self.extractpath
+                self._binary_filename = os.path.split(self.extractpath)[1]
+        return self._binary_filename
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ManPage:
     syntaxes: list[str]
     abstract: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class IndexItem:
     """
     An  entry in the risset index
@@ -669,8 +946,11 @@ class IndexItem:
     name: str
     url: str
     path: str = ''
+    _manifest_path: Path | None = field(default=None, init=False, repr=False, compare=False)
 
     def manifest_path(self) -> Path:
+        if self._manifest_path is not None:
+            return self._manifest_path
         localpath = _git_local_path(self.url)
         assert localpath.exists()
         manifest_path = localpath / self.path
@@ -678,9 +958,10 @@ class IndexItem:
             assert manifest_path.suffix == ".json"
         else:
             manifest_path = manifest_path / "risset.json"
-        if not manifest_path.exists():
-            raise RuntimeError(f"For plugin {self.name} ({self.url}, cloned at {localpath}"
-                               f" the manifest was not found at the expected path: {manifest_path}")
+            if not manifest_path.is_file():
+                raise RuntimeError(f"For plugin {self.name} ({self.url}, cloned at {localpath}"
+                                   f" the manifest was not found at the expected path: {manifest_path}")
+        self._manifest_path = manifest_path
         return manifest_path
 
     def update(self) -> None:
@@ -697,7 +978,7 @@ class IndexItem:
         Raises: PluginDefinitionError if there is an error
         """
         manifest = self.manifest_path()
-        assert manifest.exists() and manifest.suffix == '.json'
+        assert manifest.suffix == '.json'
         try:
             plugin = _read_plugindef(manifest.as_posix(), url=self.url,
                                      manifest_relative_path=self.path)
@@ -712,7 +993,7 @@ class IndexItem:
         return plugin
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Plugin:
     """
     Attribs:
@@ -758,6 +1039,9 @@ class Plugin:
     long_description: str = ''
     doc_folder: str = 'doc'
     assets: list[Asset] | None = None
+    _found_binaries: dict[tuple[str, int], Binary | None] | None = field(default=None, init=False, repr=False,
+                                                                         compare=False)
+    _binaries_by_platform: dict[str, list[Binary]] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         assert isinstance(self.binaries, list) and all(isinstance(b, Binary) for b in self.binaries)
@@ -780,8 +1064,13 @@ class Plugin:
         return self.cloned_path / self.manifest_relative_path / "risset.json"
 
     def asdict(self) -> dict:
-        d = _asdict(self)
-        return d
+        """
+        This plugin as a dict
+
+        Binaries and assets are converted to dicts and all values are copied.
+        Fields used for memoization are not included
+        """
+        return _asdict(self, dict_factory=_dict_without_memo_fields)
 
     def manpage(self, opcode: str) -> Path | None:
         """
@@ -837,23 +1126,36 @@ class Plugin:
         if not platformid:
             platformid = _session.platformid
 
-        possible_binaries = [b for b in self.binaries
-                             if b.platform == platformid and b.matches_versionid(csound_version)]
+        if self._found_binaries is None:
+            self._found_binaries = {}
+        elif (out := self._found_binaries.get((platformid, csound_version), _UNSET)) is not _UNSET:
+            return out
+
+        if self._binaries_by_platform is None:
+            # Group the binaries by platform, keeping the order of definition
+            self._binaries_by_platform = {}
+            for b in self.binaries:
+                self._binaries_by_platform.setdefault(b.platform, []).append(b)
+
+        possible_binaries = [b for b in self._binaries_by_platform.get(platformid, ())
+                             if b.matches_versionid(csound_version)]
         if not possible_binaries:
             _debug(f"Plugin '{self.name}' does not seem to have a binary for platform '{platformid}'. "
                    f"Found binaries for platforms: {[b.platform for b in self.binaries]}")
-            return None
+            binary = None
         else:
             if len(possible_binaries) > 1:
                 _debug(f"Found multiple binaries for {self.name}. Will select the first one")
-            return possible_binaries[0]
+            binary = possible_binaries[0]
+        self._found_binaries[(platformid, csound_version)] = binary
+        return binary
 
     def available_binaries(self) -> list[str]:
         return [f"{binary.platform}/csound{binary.csound_version}"
                 for binary in self.binaries]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Opcode:
     name: str
     plugin: str
@@ -923,6 +1225,8 @@ def user_plugins_path(version: int | tuple[int, int] | None = None) -> Path:
         raise TypeError(f"Expected an int major version (6, or 7), a version "
                         f"tuple (6, 0) or None to use the installed version, "
                         f"got {version}")
+    if (out := _session.cache.get(f'user_plugins_path_{major}')) is not None:
+        return out
     cs_user_plugindir = os.getenv("CS_USER_PLUGINDIR")
     if cs_user_plugindir:
         out = Path(cs_user_plugindir)
@@ -933,6 +1237,7 @@ def user_plugins_path(version: int | tuple[int, int] | None = None) -> Path:
             'darwin': f'$HOME/Library/csound/{major}.{minor}/plugins64'
         }[sys.platform]
         out = Path(os.path.expandvars(pluginsdir))
+    _session.cache[f'user_plugins_path_{major}'] = out
     return out
 
 
@@ -940,26 +1245,149 @@ def _is_glob(s: str) -> bool:
     return "*" in s or "?" in s
 
 
+@functools.lru_cache(maxsize=256)
+def _glob_matcher(pattern: str) -> Callable[[str], re.Match | None]:
+    """
+    A function matching a name against the given glob pattern
+
+    Names must be passed through os.path.normcase, as fnmatch.fnmatch does
+    """
+    import fnmatch
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def _zip_extract_member(z: ZipFile, info: ZipInfo, root: Path, madedirs: set[str] | None = None,
+                        bufsize=1 << 20) -> Path:
+    """
+    Extract a member of a zip file, like ZipFile.extract
+
+    The data is copied with a large buffer and empty files are just created.
+
+    Args:
+        z: the open zip file
+        info: the member to extract
+        root: the folder to extract to
+        madedirs: if given, folders already created, to avoid recreating them.
+            It is updated in place
+        bufsize: size of the buffer used to copy the data
+
+    Returns:
+        the path of the extracted file or folder
+    """
+    # Sanitize the path in the same way as ZipFile.extract
+    arcname = info.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in invalid)
+    target = os.path.normpath(os.path.join(root, arcname))
+    if info.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return Path(target)
+    parent = os.path.dirname(target)
+    if madedirs is None or parent not in madedirs:
+        os.makedirs(parent, exist_ok=True)
+        if madedirs is not None:
+            madedirs.add(parent)
+    if info.file_size == 0:
+        open(target, 'wb').close()
+    else:
+        with z.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, bufsize)
+    return Path(target)
+
+
+def _zip_extract_members(zipfile: Path, infos: list[ZipInfo], root: Path, z: ZipFile | None = None
+                         ) -> list[Path]:
+    """
+    Extract multiple members of a zip file, concurrently if there are many
+
+    Each worker thread opens its own handle to the zip file, so that reads
+    do not interfere with each other. zlib releases the GIL while decompressing
+    and so does writing to disk, so the extraction does run in parallel
+
+    Args:
+        zipfile: the path to the zip file
+        infos: the members to extract
+        root: the folder to extract to
+        z: if given, the open zip file, used when extracting serially
+
+    Returns:
+        the extracted paths, in the order of infos
+    """
+    from zipfile import ZipFile
+    madedirs: set[str] = set()
+    if len(infos) < 4:
+        if z is not None:
+            return [_zip_extract_member(z, info, root, madedirs=madedirs) for info in infos]
+        with ZipFile(zipfile, 'r') as z:
+            return [_zip_extract_member(z, info, root, madedirs=madedirs) for info in infos]
+
+    import threading
+    local = threading.local()
+    handles: list[ZipFile] = []
+
+    def extract(info: ZipInfo) -> Path:
+        handle = getattr(local, 'zipfile', None)
+        if handle is None:
+            handle = local.zipfile = ZipFile(zipfile, 'r')
+            handles.append(handle)
+        return _zip_extract_member(handle, info, root, madedirs=madedirs)
+
+    try:
+        return _run_concurrently(extract, infos, maxworkers=min(os.cpu_count() or 1, 8))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
 def _zip_extract_folder(zipfile: Path,
                         folder: str,
                         cleanup=True,
-                        destroot: Path | None = None
+                        destroot: Path | None = None,
+                        z: ZipFile | None = None
                         ) -> Path:
+    """
+    Extract a folder within a zip file
+
+    Args:
+        zipfile: the path to the zip file
+        folder: the folder within the zip file
+        cleanup: if True, remove the temporary folder used for extraction
+        destroot: the folder to place the extracted folder in. Defaults to the
+            temporary folder
+        z: if given, the open zip file. Otherwise the zip file is opened here
+
+    Returns:
+        the path to the extracted folder
+    """
+    import tempfile
     foldername = os.path.split(folder)[1]
     root = Path(tempfile.mktemp())
     root.mkdir(parents=True, exist_ok=True)
-    z = ZipFile(zipfile, 'r')
-    pattern = folder + '/*'
-    extracted = [z.extract(name, root) for name in z.namelist()
-                 if fnmatch.fnmatch(name, pattern)]
-    _debug(f"_zip_extract_folder: Extracted files from folder {folder}: {extracted}")
+    normcase = os.path.normcase
+    prefix = normcase(folder + '/')
+    if z is None:
+        from zipfile import ZipFile
+        with ZipFile(zipfile, 'r') as z:
+            return _zip_extract_folder(zipfile, folder, cleanup=cleanup, destroot=destroot, z=z)
+    members = [info for info in z.infolist() if normcase(info.filename).startswith(prefix)]
+    extracted = _zip_extract_members(zipfile, members, root, z=z)
+    if _session.debug:
+        _debug(f"_zip_extract_folder: Extracted files from folder {folder}: {extracted}")
     if destroot is None:
         destroot = Path(tempfile.gettempdir())
     destfolder = destroot / foldername
     if destfolder.exists():
         _debug(f"_zip_extract_folder: Destination folder {destfolder} already exists, removing")
         _rm_dir(destfolder)
-    shutil.move(root / folder, destroot)
+    try:
+        # A rename is enough if both are within the same filesystem
+        os.replace(root / folder, destfolder)
+    except OSError as e:
+        _debug(f"Could not rename {root / folder} to {destfolder} ({e}), moving instead")
+        shutil.move(root / folder, destroot)
     assert destfolder.exists() and destfolder.is_dir()
     if cleanup:
         _rm_dir(root)
@@ -979,26 +1407,53 @@ def _zip_extract(zipfile: Path, patterns: list[str]) -> list[Path]:
         more output files than number of patterns. Otherwise there is a 1 to 1
         relationship between input and output
     """
+    import tempfile
+    from zipfile import ZipFile
     outfolder = Path(tempfile.gettempdir())
-    z = ZipFile(zipfile, 'r')
-    out: list[Path] = []
-    zipped = z.namelist()
-    _debug(f"Inspecting zipfile {zipfile}, contents: {zipped}")
-    for pattern in patterns:
-        if _is_glob(pattern):
-            _debug(f"Matching names against pattern {pattern}")
-            for name in zipped:
-                if name.endswith("/") and fnmatch.fnmatch(name[:-1], pattern):
-                    # a folder
-                    out.append(_zip_extract_folder(zipfile, name[:-1]))
-                elif fnmatch.fnmatch(name, pattern):
-                    _debug(f"   Name {name} matches!")
-                    out.append(Path(z.extract(name, path=outfolder.as_posix())))
+    normcase = os.path.normcase
+    globs = [(i, _glob_matcher(pattern)) for i, pattern in enumerate(patterns) if _is_glob(pattern)]
+    # Pairs (pattern index, member to extract or extracted folder). Members are
+    # extracted together at the end, to be able to do it concurrently
+    items: list[tuple[int, ZipInfo | Path]] = []
+    with ZipFile(zipfile, 'r') as z:
+        for i, pattern in enumerate(patterns):
+            if not _is_glob(pattern):
+                # ZipFile.getinfo is a dict lookup. All literal patterns are resolved
+                # before extracting anything, so that a missing member fails fast
+                try:
+                    items.append((i, z.getinfo(pattern)))
+                except KeyError:
+                    raise KeyError(f"'{pattern}' not found in zip file {zipfile}") from None
+        if globs:
+            infos = z.infolist()
+            if _session.debug:
+                _debug(f"Inspecting zipfile {zipfile}, contents: {[info.filename for info in infos]}")
+                _debug(f"Matching names against patterns {[patterns[i] for i, _ in globs]}")
+            # A single pass over the members, each member is extracted for the first
+            # pattern it matches
+            for info in infos:
+                name = info.filename
+                foldername = normcase(name[:-1]) if name.endswith("/") else ''
+                normname = normcase(name)
+                for i, match in globs:
+                    if foldername and match(foldername):
+                        items.append((i, _zip_extract_folder(zipfile, name[:-1], z=z)))
+                        break
+                    elif match(normname):
+                        if _session.debug:
+                            _debug(f"   Name {name} matches {patterns[i]}")
+                        items.append((i, info))
+                        break
                 else:
-                    _debug(f"   Name {name} does not match")
-        else:
-            out.append(Path(z.extract(pattern, path=outfolder)))
-    return out
+                    if _session.debug:
+                        _debug(f"   Name {name} does not match")
+        members = [item for _, item in items if not isinstance(item, Path)]
+        extracted = iter(_zip_extract_members(zipfile, members, outfolder, z=z))
+    # Return the extracted paths in the order of the patterns
+    outputs: list[list[Path]] = [[] for _ in patterns]
+    for i, item in items:
+        outputs[i].append(item if isinstance(item, Path) else next(extracted))
+    return [path for paths in outputs for path in paths]
 
 
 def _zip_extract_file(zipfile: Path, extractpath: str) -> Path:
@@ -1017,19 +1472,55 @@ def _zip_extract_file(zipfile: Path, extractpath: str) -> Path:
     return _zip_extract(zipfile, [extractpath])[0]
 
 
+def _plugin_dirs_mtimes() -> tuple[int, ...]:
+    """
+    Modification times of the user and system plugin folders
+
+    The folders are determined for both csound 6 and 7 without querying
+    libcsound for the installed version. Folders which do not exist are
+    given a modification time of 0
+    """
+    dirs = []
+    for major in (6, 7):
+        dirs.append(user_plugins_path(major))
+        opcodedir = os.getenv(f"OPCODE{major}DIR64")
+        if opcodedir:
+            dirs.extend(Path(p) for p in opcodedir.split(_get_path_separator()))
+        else:
+            dirs.extend(default_system_plugins_path(major=major))
+    mtimes = []
+    for d in dirs:
+        try:
+            mtimes.append(d.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
+
 def _csound_opcodes(method='api') -> set[str]:
     """
     Returns a set of installed opcodes
 
+    The result is memoized for as long as neither the user nor the system
+    plugins folders are modified
+
     Args:
-        method: one of 'csound', 'api'
+        method: one of 'csound', 'api'. If 'api' is given but libcsound
+            is not available, falls back to calling csound
     """
     if method == 'api':
         try:
             import libcsound
         except ImportError:
             method = 'csound'
-    
+
+    if method not in ('csound', 'api'):
+        raise ValueError(f"Method '{method}' unknown, possible methods: 'csound', 'api'")
+
+    key = ('csound-opcodes', method, _plugin_dirs_mtimes())
+    if (cached := _session.cache.get(key)) is not None:
+        return cached
+
     if method == 'csound':
         csound_bin = _get_csound_binary("csound")
         if not csound_bin:
@@ -1043,15 +1534,16 @@ def _csound_opcodes(method='api') -> set[str]:
                 continue
             parts = line.split()
             opcodes.append(parts[0])
-        return set(opcodes)
-    elif method == 'api':
+        out = set(opcodes)
+    else:
         import libcsound
         cs = libcsound.Csound()
-        return set(opcode.name for opcode in cs.getOpcodes())
-    else:
-        raise ValueError(f"Method '{method}' unknown, possible methods: 'csound', 'api'")
+        out = set(opcode.name for opcode in cs.getOpcodes())
+    _session.cache[key] = out
+    return out
 
 
+@functools.lru_cache(maxsize=None)
 def _plugin_extension() -> str:
     return {
         'linux': '.so',
@@ -1060,6 +1552,7 @@ def _plugin_extension() -> str:
     }[sys.platform]
 
 
+@functools.lru_cache(maxsize=None)
 def _get_path_separator() -> str:
     """Returns the path separator for the current platform"""
     if sys.platform == "win32":
@@ -1086,15 +1579,30 @@ def _get_shell() -> str | None:
 
 
 def _get_csound_binary(binary) -> str | None:
-    if (out := _session.cache.get('csound-bin', _UNSET)) is _UNSET:
-        path = shutil.which(binary)
-        _session.cache['csound-bin'] = out = path if path else None
+    """
+    The path to the given csound binary, or None if not found
+
+    For the csound binary itself the RISSET_CSOUND_BINARY env variable, if set
+    to an existing file, is used instead of searching the PATH
+    """
+    key = ('csound-bin', binary)
+    if (out := _session.cache.get(key, _UNSET)) is _UNSET:
+        envpath = os.environ.get("RISSET_CSOUND_BINARY") if binary == "csound" else None
+        path = envpath if envpath and os.path.isfile(envpath) else shutil.which(binary)
+        _session.cache[key] = out = path if path else None
     return out
 
 
 def _get_git_binary() -> str:
+    """
+    The path to the git binary. Raises RuntimeError if not found
+
+    The RISSET_GIT_BINARY env variable, if set to an existing file, is used
+    instead of searching the PATH
+    """
     if (path := _session.cache.get('git-binary')) is None:
-        path = shutil.which("git")
+        envpath = os.environ.get("RISSET_GIT_BINARY")
+        path = envpath if envpath and os.path.isfile(envpath) else shutil.which("git")
         if not path or not os.path.exists(path):
             raise RuntimeError("git binary not found")
         _session.cache['git-binary'] = path
@@ -1123,14 +1631,17 @@ def _git_local_path(repo: str, update=False) -> Path:
     _debug(f"Querying local path for repo {repo}")
     reponame = _git_reponame(repo)
     destination = RISSET_CLONES_PATH / reponame
-    if destination.exists():
-        assert _is_git_repo(destination), f"Expected {destination} to be a git repository"
-        _session.cloned_repos[repo] = destination
-        if update:
-            _git_update(destination)
-    else:
-        _git_clone_into(repo, destination=destination, depth=1)
-        _session.cloned_repos[repo] = destination
+    with _session.clone_lock(destination):
+        if destination.exists():
+            assert _is_git_repo(destination), f"Expected {destination} to be a git repository"
+            _session.cloned_repos[repo] = destination
+            cloned = False
+        else:
+            _git_clone_into(repo, destination=destination, depth=_GIT_DEPTH)
+            _session.cloned_repos[repo] = destination
+            cloned = True
+    if update and not cloned:
+        _git_update(destination)
     return destination
 
 
@@ -1142,6 +1653,8 @@ def _git_clone_into(repo: str, destination: Path, depth=1) -> None:
         repo: the url to the repository
         destination: local path where the repository will be cloned
         depth: if > 0, the depth of the clone.
+
+    Raises RuntimeError if the clone failed
     """
     if not isinstance(destination, Path):
         raise TypeError("destination should be a Path")
@@ -1155,7 +1668,13 @@ def _git_clone_into(repo: str, destination: Path, depth=1) -> None:
     if depth > 0:
         args.extend(["--depth", str(depth)])
     args.extend([repo, str(destination)])
-    _subproc_call(args)
+    if _subproc_call(args) != 0:
+        # Remove any partial clone, so that a later attempt can clone it again. The
+        # destination did not exist before (checked above), so it was created here
+        if destination.exists():
+            _rm_dir(destination)
+        raise RuntimeError(f"Could not clone git repository {repo} into {destination}")
+    _session.fresh_clones.add(destination)
 
 
 def _git_repo_needs_update(repopath: Path) -> bool:
@@ -1165,20 +1684,25 @@ def _git_repo_needs_update(repopath: Path) -> bool:
     NB: for our use case, where no merges are expected, to update is just
     as fast as to check first and then act.
     """
-    cwd = os.path.abspath(os.path.curdir)
-    os.chdir(str(repopath))
     git = _get_git_binary()
-    _subproc_call([git, "fetch"])
-    headhash = subprocess.check_output([git, "rev-parse", "HEAD"]).decode('utf-8')
-    upstreamhash = subprocess.check_output([git, "rev-parse", "master@{upstream}"]).decode('utf-8')
+    # ls-remote only queries the remote refs, without fetching any objects
+    remote = subprocess.check_output([git, "ls-remote", "origin", "HEAD"], cwd=repopath).decode('utf-8').split()
+    upstreamhash = remote[0] if remote else ''
+    headhash = subprocess.check_output([git, "rev-parse", "HEAD"], cwd=repopath).decode('utf-8').strip()
     _debug(f"Checking hashes, head: {headhash}, upstream: {upstreamhash}")
-    os.chdir(cwd)
     return headhash != upstreamhash
 
 
-def _git_update(repopath: Path, depth=0, check_if_needed=False) -> None:
+def _git_update(repopath: Path, depth=_GIT_DEPTH, check_if_needed=False) -> None:
     """
     Update the git repo at the given path
+
+    Args:
+        repopath: the path to the local repository
+        depth: if > 0, the repository is a shallow clone. It is updated by
+            fetching only the latest revision of the remote and resetting to it,
+            since pulling into a shallow clone can fail to merge
+        check_if_needed: if True, check first if the repository needs to be updated
     """
     _debug(f"Updating git repository: {repopath}")
     if not repopath.exists():
@@ -1187,18 +1711,70 @@ def _git_update(repopath: Path, depth=0, check_if_needed=False) -> None:
         _debug(f"Repository {repopath} up to date")
         return
     gitbin = _get_git_binary()
-    cwd = os.path.abspath(os.path.curdir)
-    os.chdir(str(repopath))
-    args = [gitbin, "pull"]
     if depth > 0:
-        args.extend(['--depth', str(depth)])
-    if _session.debug:
-        subprocess.call(args)
+        # These clones are never modified locally, so resetting is safe
+        cmds = [[gitbin, "fetch", "--depth", str(depth), "origin", "HEAD"],
+                [gitbin, "reset", "--hard", "FETCH_HEAD"]]
     else:
-        subprocess.call(args, stdout=subprocess.PIPE)
-    os.chdir(cwd)
+        cmds = [[gitbin, "pull"]]
+    # Use cwd instead of changing the process directory, so that multiple
+    # repositories can be updated concurrently
+    stdout = None if _session.debug else subprocess.PIPE
+    for args in cmds:
+        if subprocess.call(args, stdout=stdout, cwd=repopath) != 0:
+            _debug(f"Failed to update git repository {repopath}")
+            break
+    else:
+        _session.updated_repos.add(repopath)
+
+
+def _run_concurrently(func: Callable, items: list, maxworkers=0) -> list:
+    """
+    Call func on each item using a pool of threads
+
+    Args:
+        func: the function to call, with one item as argument
+        items: the items to process
+        maxworkers: max. number of concurrent calls. If not given, use the value
+            of the RISSET_JOBS env variable or 8
+
+    Returns:
+        the results, in the order of items. If any call raises an exception,
+        the calls not yet started are cancelled and the exception is propagated
+        once the calls already running have finished
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    if not maxworkers:
+        maxworkers = int(os.environ.get("RISSET_JOBS", 8))
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=min(maxworkers, len(items))) as executor:
+        futures = {executor.submit(func, item): i for i, item in enumerate(items)}
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return results
+
+
+def _git_update_many(repopaths: Iterable[Path]) -> None:
+    """
+    Update multiple git repositories concurrently
+
+    Repositories cloned or already updated during this session are skipped
+
+    Args:
+        repopaths: the paths of the repositories to update
+    """
+    skip = _session.fresh_clones | _session.updated_repos
+    pending = list(dict.fromkeys(path for path in repopaths if path not in skip))
+    _run_concurrently(_git_update, pending)
 
 
+@functools.lru_cache(maxsize=None)
 def _version_tuple(versionstr: str) -> tuple[int, int, int]:
     """ Convert a version string to its integer parts """
     if not versionstr:
@@ -1243,22 +1819,34 @@ def _find_system_plugins_path(possible_paths: list[Path], majorversion) -> Path
     for d in possible_paths:
         _debug(">> looking at ", d)
         path = d.expanduser().resolve()
-        if not path.is_dir() or not path.exists():
+        try:
+            with os.scandir(path) as it:
+                plugins = [entry.name for entry in it if entry.name.endswith(ext)]
+        except OSError:
             _debug(">>> path does not exist...")
             continue
-        plugins = list(path.glob("*" + ext))
         if not plugins:
             _debug(f">>> path {d} exists, but has no plugins, skipping")
-        elif any(plugin for plugin in plugins if dll == plugin.name):
+        elif dll in plugins:
             _debug(">>> Found!")
             return path
         else:
             _debug(f">>> Path exists, but it does not seem to be the systems plugin path\n"
                    f">>> ({dll} was not found there)")
-            _debug(f">>> Plugins found here: ", ', '.join(plugin.name for plugin in plugins))
+            _debug(f">>> Plugins found here: ", ', '.join(plugins))
     return None
 
 
+def _load_json(path: str | Path):
+    """
+    Load a json file, with a single read and parsing the raw bytes
+
+    Raises json.JSONDecodeError if the file could not be parsed
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
 def _load_installation_manifest(path: Path) -> dict:
     """
     Load an installation manifest
@@ -1270,13 +1858,18 @@ def _load_installation_manifest(path: Path) -> dict:
     """
     assert path.suffix == '.json'
     try:
-        d = json.load(open(path))
-        return d
+        return _load_json(path)
     except json.JSONDecodeError as e:
         _errormsg(f"Could not parse manifest json: {path}")
         raise e
 
 
+# An url has a scheme and a network location, as in urllib.parse.urlparse
+_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#]')
+
+_BINARY_SUFFIXES = frozenset(('.so', '.dll', '.dylib'))
+
+
 def _is_url(s: str) -> bool:
     """
     Is `s` a valid url?
@@ -1284,8 +1877,7 @@ def _is_url(s: str) -> bool:
     Args:
         s: URL address string to validate
     """
-    result = urllib.parse.urlparse(str(s))
-    return bool(result.scheme and result.netloc)
+    return _URL_RE.match(str(s)) is not None
 
 
 def _parse_pluginkey(pluginkey: str) -> tuple[str, str]:
@@ -1302,6 +1894,7 @@ def _parse_pluginkey(pluginkey: str) -> tuple[str, str]:
     return name, version
 
 
+@functools.lru_cache(maxsize=None)
 def _normalize_version(version: str, default="0.0.0") -> str:
     try:
         versiontup = _version_tuple(version)
@@ -1315,6 +1908,9 @@ def _expand_substitutions(s: str, substitutions: dict[str, str]) -> str:
     """
     Expands variables of the form $var or ${var}
     """
+    if '$' not in s:
+        # The common case, there is nothing to substitute
+        return s
     t = _Template(s)
     return t.substitute(substitutions)
 
@@ -1378,11 +1974,7 @@ def _parse_asset(assetdef: dict, defaultsource: str) -> Asset:
     return Asset(source=source, patterns=paths, platform=assetdef.get('platform', 'all'), name=assetdef.get('name', ''))
 
 
-def _enforce_key(d: dict, key: str):
-    value = d.get(key)
-    if value is None:
-        raise SchemaError(f"Plugin has no {key} key")
-    return value
+_PLUGIN_REQUIRED_KEYS = ('name', 'version', 'short_description', 'author', 'email', 'opcodes', 'binaries')
 
 
 def _plugin_from_dict(d: dict, pluginurl: str, subpath: str) -> Plugin:
@@ -1392,16 +1984,21 @@ def _plugin_from_dict(d: dict, pluginurl: str, subpath: str) -> Plugin:
         pluginurl: the url of this plugin
         subpath: the path of the manifest's folder, relative to the root of the repository
     """
+    try:
+        values = [d[key] for key in _PLUGIN_REQUIRED_KEYS]
+    except KeyError as e:
+        raise SchemaError(f"Plugin has no {e.args[0]} key")
+    if None in values:
+        raise SchemaError(f"Plugin has no {_PLUGIN_REQUIRED_KEYS[values.index(None)]} key")
+    pluginname, version, short_description, author, email, opcodes, binarydefs = values
     clonepath = _git_local_path(pluginurl)
-    version = _normalize_version(_enforce_key(d, 'version'))
-    pluginname = _enforce_key(d, 'name')
-    opcodes = _enforce_key(d, 'opcodes')
+    version = _normalize_version(version)
     opcodes.sort()
     substitutions = {key: str(value) for key, value in d.items() if isinstance(value, (int, float, str))}
 
     binaries: list[Binary] = []
-    binarydefs = _enforce_key(d, 'binaries')
     if not isinstance(binarydefs, list):
+        import pprint
         s = pprint.pformat(binarydefs)
         _errormsg(f"Expected a list of binary definitions, got: ")
         _errormsg(s)
@@ -1412,7 +2009,8 @@ def _plugin_from_dict(d: dict, pluginurl: str, subpath: str) -> Plugin:
             _errormsg(f"{pluginname}: Parsing 'binaries' key, expected a dict, got")
             raise SchemaError(f"Parsing 'binaries', Expected a dict, got {binarydef}")
         try:
-            _debug(f"Parsing binary definition for {pluginname}: {binarydef}")
+            if _session.debug:
+                _debug(f"Parsing binary definition for {pluginname}: {binarydef}")
             binary = _parse_binarydef(binarydef, substitutions=substitutions)
             binaries.append(binary)
         except ParseError as e:
@@ -1440,11 +2038,11 @@ def _plugin_from_dict(d: dict, pluginurl: str, subpath: str) -> Plugin:
                 _errormsg(str(e))
 
     return Plugin(
-        name=_enforce_key(d, 'name'),
+        name=pluginname,
         version=version,
-        short_description=_enforce_key(d, 'short_description'),
-        author=_enforce_key(d, 'author'),
-        email=_enforce_key(d, 'email'),
+        short_description=short_description,
+        author=author,
+        email=email,
         opcodes=opcodes,
         binaries=binaries,
         doc_folder=d.get('doc', ''),
@@ -1452,7 +2050,7 @@ def _plugin_from_dict(d: dict, pluginurl: str, subpath: str) -> Plugin:
         url=pluginurl,
         manifest_relative_path=subpath,
         assets=assets,
-        cloned_path=_git_local_path(pluginurl)
+        cloned_path=clonepath
     )
 
 
@@ -1461,13 +2059,15 @@ def _resolve_path(path: str | Path,
                   ) -> Path:
     """
     Convert path to absolute, use `basedir` or the cwd as base
+
+    The path is normalized lexically, symlinks are not resolved
     """
-    p = Path(path)
-    if p.is_absolute():
-        return p.resolve()
+    p = os.fspath(path)
+    if os.path.isabs(p):
+        return Path(os.path.normpath(p))
     if basedir is None:
-        return (Path.cwd()/p).resolve()
-    return (Path(basedir) / p).resolve()
+        return Path(os.path.abspath(p))
+    return Path(os.path.normpath(os.path.join(os.path.abspath(basedir), p)))
 
 
 def _rm_dir(path: Path) -> None:
@@ -1490,24 +2090,51 @@ def _rm_dir(path: Path) -> None:
 
 
 def _copy_recursive(src: Path, dest: Path) -> None:
-    if not dest.exists():
-        raise OSError(f"Destination path ({dest.as_posix()}) does not exist")
     if not dest.is_dir():
+        if not dest.exists():
+            raise OSError(f"Destination path ({dest.as_posix()}) does not exist")
         raise OSError(f"Destination path ({dest.as_posix()}) should be a directory")
 
     if src.is_dir():
         _debug(f"Copying all files under {str(src)} to {str(dest)}")
-        for f in src.glob("*"):
-            _debug("    ", str(f))
-            if f.is_dir():
-                shutil.copytree(f.absolute().as_posix(), dest.as_posix())
-            else:
-                shutil.copy(f.as_posix(), dest.as_posix())
+        destpath = dest.as_posix()
+        with os.scandir(src) as it:
+            for entry in it:
+                _debug("    ", entry.path)
+                if entry.is_dir():
+                    shutil.copytree(entry.path, os.path.join(destpath, entry.name),
+                                    copy_function=shutil.copy)
+                else:
+                    shutil.copy(entry.path, destpath)
     else:
         _debug(f"Copying file {str(src)} to {str(dest)}")
         shutil.copy(src.as_posix(), dest.as_posix())
 
 
+def _install_file(src: Path, dest: Path) -> None:
+    """
+    Place src at dest, moving it if it is a temporary file
+
+    Files extracted to the temporary folder are not reused and can be
+    moved instead of copied. Downloaded files (which are cached during the
+    session) or files within a cloned repository are always copied
+
+    Args:
+        src: the file to install
+        dest: the destination path (a file path, not a folder)
+    """
+    import tempfile
+    srcstr = os.fspath(src)
+    if (srcstr.startswith(tempfile.gettempdir()) and
+            src not in _session.downloaded_files.values()):
+        try:
+            os.replace(srcstr, dest)
+            return
+        except OSError as e:
+            _debug(f"Could not move {srcstr} to {dest} ({e}), copying instead")
+    shutil.copy(srcstr, dest)
+
+
 def _read_plugindef(filepath: str | Path,
                     url: str = '',
                     manifest_relative_path: str = ''
@@ -1536,8 +2163,8 @@ def _read_plugindef(filepath: str | Path,
     _debug("Parsing manifest:", path)
 
     try:
-        d = json.load(open(path))
-    except json.decoder.JSONDecodeError as e:
+        d = _load_json(path)
+    except json.JSONDecodeError as e:
         _errormsg(f"Could not parse json file {path}:\n    {e}")
         raise e
 
@@ -1593,11 +2220,19 @@ def _make_install_manifest(plugin: Plugin, assetfiles: list[str] | None = None
     return out
 
 
-def _print_with_line_numbers(s: str) -> None:
+def _print_with_line_numbers(s: str | bytes) -> None:
+    """
+    Print the given text with line numbers. Bytes are decoded as utf-8
+    """
+    if isinstance(s, bytes):
+        s = s.decode('utf-8', errors='replace')
     for i, line in enumerate(s.splitlines()):
         print(f"{i+1:003d} {line}")
 
 
+_RE_CONTENT_DISPOSITION_FILENAME = re.compile('filename=(.+)')
+
+
 def _filename_from_content_disposition(cd: str) -> str:
     """
     Get filename from content-disposition
@@ -1612,7 +2247,7 @@ def _filename_from_content_disposition(cd: str) -> str:
     """
     if not cd:
         return ''
-    fname = re.findall('filename=(.+)', cd)
+    fname = _RE_CONTENT_DISPOSITION_FILENAME.findall(cd)
     if len(fname) == 0:
         return ''
     return fname[0]
@@ -1639,9 +2274,41 @@ def _download_file(url: str, destination_folder='', cache=True) -> Path:
             return destpath
         else:
             return cachedpath
+    # A file downloaded in a previous session is reused if the server reports
+    # that it has not been modified since
+    headers = {}
+    previous = _session.downloads_cache.get(url) if cache else None
+    if previous is not None:
+        try:
+            unchanged = previous[0].stat().st_mtime_ns == previous[1]
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            # Removed or overwritten since it was downloaded
+            previous = None
+    if previous is not None:
+        validators = previous[2]
+        if etag := validators.get('ETag'):
+            headers['If-None-Match'] = etag
+        if lastmodified := validators.get('Last-Modified'):
+            headers['If-Modified-Since'] = lastmodified
     _debug("Downloading url", url)
+    import requests
     try:
-        resp = requests.get(url, verify=True, allow_redirects=True)
+        resp = _session.http.get(url, verify=True, allow_redirects=True, stream=True, headers=headers)
+        if resp.status_code == 304 and previous is not None:
+            resp.close()
+            _debug(f"File not modified since last download, using '{previous[0]}'")
+            cachedpath = previous[0]
+            _session.downloaded_files[url] = cachedpath
+            if destination_folder:
+                destpath = Path(destination_folder) / cachedpath.name
+                shutil.copy(cachedpath, destpath)
+                return destpath
+            return cachedpath
+        if not resp.ok:
+            resp.close()
+            raise RuntimeError(f"Could not download url '{url}', status: {resp.status_code} {resp.reason}")
         contentdisp = resp.headers.get('content-disposition')
         if contentdisp is not None:
             contentdisp_filename = _filename_from_content_disposition(contentdisp)
@@ -1651,16 +2318,24 @@ def _download_file(url: str, destination_folder='', cache=True) -> Path:
     except requests.ConnectionError as err:
         _errormsg(f"Connection error while trying to download url: '{url}'")
         raise err
+    except RuntimeError:
+        raise
     except Exception as err:
         _errormsg(f"Unknown exception while trying to download url: '{url}'")
         raise err
 
     if not destination_folder:
+        import tempfile
         destination_folder = tempfile.gettempdir()
     destpath = Path(destination_folder) / baseoutfile
     _debug(f"Writing downloaded content from url '{url}' to file '{destpath}'")
-    open(destpath, 'wb').write(resp.content)
+    with resp, open(destpath, 'wb') as f:
+        for chunk in resp.iter_content(chunk_size=1 << 20):
+            f.write(chunk)
     _session.downloaded_files[url] = destpath
+    validators = {key: resp.headers[key] for key in ('ETag', 'Last-Modified') if key in resp.headers}
+    if validators:
+        _session.downloads_cache.set(url, (destpath, destpath.stat().st_mtime_ns, validators))
     return destpath
 
 
@@ -1759,6 +2434,38 @@ def _system_plugins_path(majorversion: int) -> Path | None:
     return out
 
 
+def _list_plugin_dlls(path: Path) -> list[Path]:
+    """
+    List the plugin binaries within path
+
+    The listing is cached across sessions and remains valid as long as the
+    modification time of the folder does not change
+
+    Args:
+        path: the plugins folder
+
+    Returns:
+        a list of the plugin binaries found in path, or an empty list if
+        path does not exist
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+    key = path.as_posix()
+    entry = _session.dlls_cache.get(key)
+    if entry is not None and entry[0] == mtime:
+        return [path / name for name in entry[1]]
+    ext = _plugin_extension()
+    with os.scandir(path) as it:
+        # DirEntry.is_file uses the file type reported while listing the folder,
+        # it only needs a stat call for symlinks
+        names = [direntry.name for direntry in it
+                 if direntry.name.endswith(ext) and direntry.is_file()]
+    _session.dlls_cache.set(key, (mtime, names))
+    return [path / name for name in names]
+
+
 def user_installed_dlls(majorversion: int | None = None) -> list[Path]:
     """
     Return a list of plugins installed at the user plugin path.
@@ -1770,7 +2477,7 @@ def user_installed_dlls(majorversion: int | None = None) -> list[Path]:
                f"csound's version is {_session.csound_version_tuple}")
     if (out := _session.cache.get(f'user_installed_dlls_{majorversion}', _UNSET)) is _UNSET:
         path = user_plugins_path(version=majorversion)
-        out = list(path.glob("*" + _plugin_extension())) if path and path.exists() else []
+        out = _list_plugin_dlls(path) if path else []
         _session.cache[f'user_installed_dlls_{majorversion}'] = out
     return out
 
@@ -1783,7 +2490,7 @@ def system_installed_dlls(majorversion: int | None = None) -> list[Path]:
         majorversion = _session.csound_version_tuple[0]
     if (out := _session.cache.get(f'system_installed_dlls_{majorversion}')) is None:
         path = system_plugins_path(majorversion=majorversion)
-        out = list(path.glob("*" + _plugin_extension())) if path and path.exists() else []
+        out = _list_plugin_dlls(path) if path else []
         _session.cache[f'system_installed_dlls_{majorversion}'] = out
     return out
 
@@ -1815,7 +2522,7 @@ class MainIndex:
         self.indexfile = datarepo / "rissetindex.json"
         if not datarepo.exists():
             updateindex = False
-            _git_clone_into(INDEX_GIT_REPOSITORY, datarepo, depth=1)
+            _git_clone_into(INDEX_GIT_REPOSITORY, datarepo, depth=_GIT_DEPTH)
         else:
             updateindex = update
         assert datarepo.exists()
@@ -1827,8 +2534,10 @@ class MainIndex:
         self.majorversion: int = majorversion
 
         self.pluginsources: dict[str, IndexItem] = {}
-        self.plugins: dict[str, Plugin] = {}
         self._cache: dict[str, Any] = {}
+        self._stop_on_errors = False
+        self._manifests_state: list[tuple[str, int]] | None = None
+        self._plugin_manifests_state: dict[str, int] | None = None
         self._parse_index(updateindex=updateindex, updateplugins=update, stop_on_errors=False)
         self.user_plugins_path = user_plugins_path(version=self.majorversion)
         if update:
@@ -1842,54 +2551,92 @@ class MainIndex:
         error message is printed, unless fail_if_error is True, in which case the
         whole operation is cancelled
         """
-        self.plugins.clear()
+        # plugins are parsed lazily, on first access
+        self.__dict__.pop('plugins', None)
+        self._stop_on_errors = stop_on_errors
         self.pluginsources.clear()
         self._cache.clear()
         if updateindex:
             _git_update(self.datarepo)
 
-        indexstr = open(self.indexfile).read()
+        indexbytes = self.indexfile.read_bytes()
         try:
-            d = json.loads(indexstr)
+            d = _json_loads(indexbytes)
         except json.JSONDecodeError as err:
             _errormsg(f"Error while parsing json index file {self.indexfile}")
-            _print_with_line_numbers(indexstr)
+            _print_with_line_numbers(indexbytes)
             raise RuntimeError(f"Could not parse index file: {err}")
 
         self.version = d.get('version', '')
-        plugins: dict[str, Plugin] = d.get('plugins', {})
-        updated: set[Path] = set()
-
-        for name, plugindef in plugins.items():
-            assert isinstance(name, str)
-            assert isinstance(plugindef, dict)
-            url = plugindef.get('url')
-            if not url:
-                _errormsg(f"Invalid plugin source definition for plugin {name}: {plugindef}")
-                raise ValueError(f"Error while parsing the risset index. "
-                                 f"Plugin {name} does not define a url")
-            assert _is_git_url(url), f"url for plugin {name} is not a git repository: {url}"
-            path = plugindef.get('path', '')
-            pluginsource = IndexItem(name=name, url=url, path=path)
-            pluginpath = _git_local_path(url)
-            assert pluginpath.exists()
-            if updateplugins and pluginpath not in updated:
-                _git_update(pluginpath)
-                updated.add(pluginpath)
-
-            self.pluginsources[name] = pluginsource
-
-        if self.pluginsources:
-            for name, pluginsource in self.pluginsources.items():
-                try:
-                    _debug(f"Parsing plugin definition for {name}")
-                    plugin = self._parse_plugin(name)
-                    self.plugins[name] = plugin
-                except Exception as e:
-                    if stop_on_errors:
-                        raise e
-                    else:
-                        _errormsg(f"Error while parsing plugin definition for '{name}': {e}")
+        for name, plugindef in d.get('plugins', {}).items():
+            self._add_pluginsource(name, plugindef)
+
+        # Clone any missing plugin repository, then update the rest. The git
+        # operations run concurrently, since they are bound by network latency
+        # Urls sharing a repository name share a clone destination. These are
+        # handled one after the other, in the same task
+        urlgroups: dict[str, list[str]] = {}
+        for pluginsource in self.pluginsources.values():
+            group = urlgroups.setdefault(_git_reponame(pluginsource.url), [])
+            if pluginsource.url not in group:
+                group.append(pluginsource.url)
+        pathgroups = _run_concurrently(lambda urls: [_git_local_path(url) for url in urls],
+                                       list(urlgroups.values()))
+        pluginpaths = [path for paths in pathgroups for path in paths]
+        if updateplugins:
+            _git_update_many(pluginpaths)
+
+    @functools.cached_property
+    def plugins(self) -> dict[str, Plugin]:
+        """
+        The plugins defined in the index, as a dict name: Plugin
+
+        The plugin definitions are parsed the first time this is accessed. Manifests
+        are read concurrently, errors are reported in the order of the index
+        """
+        def parse(name: str) -> tuple[Plugin | None, Exception | None]:
+            if _session.debug:
+                _debug(f"Parsing plugin definition for {name}")
+            try:
+                return self._parse_plugin(name), None
+            except Exception as e:
+                return None, e
+
+        # Load the persistent cache before it is shared between threads
+        _session.plugins_cache.data()
+        names = list(self.pluginsources)
+        plugins: dict[str, Plugin] = {}
+        for name, (plugin, err) in zip(names, _run_concurrently(parse, names)):
+            if err is not None:
+                if self._stop_on_errors:
+                    raise err
+                else:
+                    _errormsg(f"Error while parsing plugin definition for '{name}': {err}")
+            else:
+                assert plugin is not None
+                plugins[name] = plugin
+        return plugins
+
+    def _add_pluginsource(self, name: str, plugindef: dict) -> None:
+        """
+        Register the plugin source defined in the main index under the given name
+
+        The plugin's repository is not cloned or updated here
+
+        Args:
+            name: the name of the plugin
+            plugindef: the definition of the plugin source, as read from the index
+        """
+        assert isinstance(name, str)
+        assert isinstance(plugindef, dict)
+        url = plugindef.get('url')
+        if not url:
+            _errormsg(f"Invalid plugin source definition for plugin {name}: {plugindef}")
+            raise ValueError(f"Error while parsing the risset index. "
+                             f"Plugin {name} does not define a url")
+        assert _is_git_url(url), f"url for plugin {name} is not a git repository: {url}"
+        path = plugindef.get('path', '')
+        self.pluginsources[name] = IndexItem(name=name, url=url, path=path)
 
     def update(self):
         """
@@ -1930,27 +2677,30 @@ class MainIndex:
         if pluginsource is None:
             raise KeyError(f"Plugin {pluginname} not known. Known plugins: {self.pluginsources.keys()}")
         manifestpath = pluginsource.manifest_path()
-        assert manifestpath.exists()
-        manifeststr = open(manifestpath).read()
+        mtime = manifestpath.stat().st_mtime_ns
+        cached = _session.plugins_cache.get(pluginname)
+        if cached is not None and cached[0] == manifestpath.as_posix() and cached[1] == mtime:
+            if _session.debug:
+                _debug(f"Using cached definition for plugin {pluginname}")
+            return cached[2]
+        manifestbytes = manifestpath.read_bytes()
         try:
-            _ = json.loads(manifeststr)
+            _ = _json_loads(manifestbytes)
         except json.JSONDecodeError as err:
             _errormsg(f"Error while parsing plugin manifest. name={pluginname}, manifest={manifestpath}")
-            _print_with_line_numbers(manifeststr)
+            _print_with_line_numbers(manifestbytes)
             raise err
-        return pluginsource.read_definition()
+        plugin = pluginsource.read_definition()
+        _session.plugins_cache.set(pluginname, (manifestpath.as_posix(), mtime, plugin))
+        return plugin
 
     def installed_dlls(self) -> dict[str, tuple[Path, bool]]:
         """
         Returns a dict mapping dll name to (installed_path: str, user_installed: bool)
         """
-        user_dlls = user_installed_dlls()
-        system_dlls = system_installed_dlls()
-        db = {}
-        for dll in user_dlls:
-            db[dll.name] = (dll, True)
-        for dll in system_dlls:
-            db[dll.name] = (dll, False)
+        # User installed dlls have priority over system installed
+        db = {dll.name: (dll, False) for dll in system_installed_dlls()}
+        db.update((dll.name, (dll, True)) for dll in user_installed_dlls())
         return db
 
     def installed_path_for_dll(self, binary: str) -> tuple[Path | None, bool]:
@@ -1996,6 +2746,58 @@ class MainIndex:
         manifests = list(path.glob("*.json"))
         return manifests
 
+    def _invalidate_installed_state(self) -> None:
+        """
+        Drop any cached data which depends on which plugins are installed
+        """
+        for key in ('manifests_by_name', 'defined_opcodes', 'opcodes_by_name'):
+            self._cache.pop(key, None)
+
+    def _manifests_with_mtimes(self) -> list[tuple[str, int]]:
+        """
+        Returns a sorted list of tuples (manifest filename, mtime_ns) for all installed manifests
+        """
+        with os.scandir(self.installed_manifests_path()) as it:
+            out = [(entry.name, entry.stat().st_mtime_ns) for entry in it if entry.name.endswith('.json')]
+        out.sort()
+        return out
+
+    def _plugin_manifests_with_mtimes(self) -> dict[str, int]:
+        """
+        Maps each parsed plugin to the mtime_ns of its manifest (-1 if not found)
+
+        Returns an empty dict if the plugins have not been parsed yet
+        """
+        plugins = self.__dict__.get('plugins')
+        if not plugins:
+            return {}
+        out = {}
+        for name in plugins:
+            # Use the path resolved while parsing, resolving it again might need git
+            pluginsource = self.pluginsources.get(name)
+            path = pluginsource._manifest_path if pluginsource is not None else None
+            try:
+                out[name] = path.stat().st_mtime_ns if path is not None else -1
+            except OSError:
+                out[name] = -1
+        return out
+
+    def _manifests_by_name(self) -> dict[str, Path]:
+        """
+        Returns a dict mapping plugin name to the path of its installation manifest
+        """
+        out = self._cache.get('manifests_by_name')
+        if out is not None:
+            return out
+        out = {}
+        with os.scandir(self.installed_manifests_path()) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    name, version = _parse_pluginkey(entry.name.split(".")[0])
+                    out.setdefault(name, Path(entry.path))
+        self._cache['manifests_by_name'] = out
+        return out
+
     def _is_plugin_recognized_by_csound(self, plugin: Plugin, method='api') -> bool:
         """
         Check if a given plugin is installed
@@ -2089,7 +2891,8 @@ class MainIndex:
         """
         Returns an InstalledPluginInfo if found, None otherwise
         """
-        _debug(f"Checking if plugin {plugin.name} is installed")
+        if _session.debug:
+            _debug(f"Checking if plugin {plugin.name} is installed")
         binary = plugin.find_binary()
         if not binary:
             _debug(f"Plugin {plugin.name} has no binary for this platform and/or csound version"
@@ -2105,25 +2908,21 @@ class MainIndex:
         installed_version = UNKNOWN_VERSION
         installed_manifest_path = None
 
-        for manifest in self.installed_manifests():
-            pluginkey = manifest.name.split(".")[0]
-            name, version = _parse_pluginkey(pluginkey)
-            if name == plugin.name:
-                try:
-                    result = _load_installation_manifest(manifest)
-                except Exception as e:
-                    _errormsg(f"Could not load installation manifest for plugin {plugin.name}, skipping. "
-                              f"Original error: {e}")
-                    continue
+        manifest = self._manifests_by_name().get(plugin.name)
+        if manifest is not None:
+            try:
+                result = _load_installation_manifest(manifest)
                 installed_version = result['version']
                 installed_manifest_path = manifest
-                break
+            except Exception as e:
+                _errormsg(f"Could not load installation manifest for plugin {plugin.name}, skipping. "
+                          f"Original error: {e}")
 
         out = InstalledPluginInfo(
             name=plugin.name,
             dllpath=dll,
             versionstr=installed_version,
-            installed_in_system_folder=str(dll.parent) == str(system_plugins_path()),
+            installed_in_system_folder=dll.parent == system_plugins_path(),
             installed_manifest_path=installed_manifest_path
         )
         return out
@@ -2184,7 +2983,7 @@ class MainIndex:
             if errormsg:
                 raise RuntimeError(f"The downloaded file {path} has an incorrect mimetype: {errormsg}")
 
-        if path.suffix in ('.so', '.dll', '.dylib'):
+        if path.suffix in _BINARY_SUFFIXES:
             return path
         elif path.suffix == '.zip':
             if not bindef.extractpath:
@@ -2199,37 +2998,79 @@ class MainIndex:
         else:
             raise SchemaError(f"Suffix {path.suffix} not supported in url: {bindef.url}")
 
+    def sorted_plugins(self) -> list[Plugin]:
+        """
+        Returns a list of all plugins, sorted by name
+        """
+        out = self._cache.get('sorted_plugins')
+        if out is None:
+            self._cache['sorted_plugins'] = out = sorted(self.plugins.values(), key=lambda plugin: plugin.name)
+        return out
+
     def opcodes_by_name(self) -> dict[str, Opcode]:
         """
         Returns a dict mapping opcodename to an Opcode definition
         """
         out = self._cache.get('opcodes_by_name')
-        if out:
+        if out is not None:
             return out
         out = {opcode.name: opcode
                for opcode in self.defined_opcodes()}
         self._cache['opcodes_by_name'] = out
         return out
 
-    def parse_manpage(self, opcode: str) -> ManPage | None:
+    def parse_manpage(self, opcode: str, plugin: Plugin | None = None) -> ManPage | None:
         """
         Parse the manual page for a given opcode
 
         Args:
             opcode: opcode name
+            plugin: the plugin defining the opcode, if known
 
         Returns:
             a ManPage, if a manpage was found for the opcode, or None
         """
-        manpage = self.find_manpage(opcode, markdown=True)
-        return _manpage_parse(manpage, opcode) if manpage else None
+        manpages = self._cache.get('manpages')
+        if manpages is None:
+            self._cache['manpages'] = manpages = {}
+        elif opcode in manpages:
+            return manpages[opcode]
+        if plugin is not None:
+            manpage = plugin.manpage(opcode)
+        else:
+            manpage = self.find_manpage(opcode, markdown=True)
+        out = _manpage_parse_cached(manpage, opcode) if manpage else None
+        manpages[opcode] = out
+        return out
+
+    def prefetch_manpages(self, opcodes: list[tuple[str, Plugin]]) -> None:
+        """
+        Parse the manpages for the given opcodes in parallel
+
+        The results are cached and later retrieved via :meth:`parse_manpage`
+
+        Args:
+            opcodes: a list of tuples (opcodename, plugin defining the opcode)
+        """
+        manpages = self._cache.get('manpages')
+        if manpages is None:
+            self._cache['manpages'] = manpages = {}
+        pending = [(opcode, path) for opcode, plugin in opcodes
+                   if opcode not in manpages and (path := plugin.manpage(opcode)) is not None]
+        if not pending:
+            return
+        # Load the persistent cache before it is shared between threads
+        _session.manpages_cache.data()
+        results = _run_concurrently(lambda item: _manpage_parse_cached(item[1], item[0]), pending)
+        for (opcode, path), manpage in zip(pending, results):
+            manpages[opcode] = manpage
 
     def defined_opcodes(self) -> list[Opcode]:
         """
         Returns a list of opcodes
         """
         cached = self._cache.get('defined_opcodes')
-        if cached:
+        if cached is not None:
             return cached
         opcodes = []
         for plugin in self.plugins.values():
@@ -2251,7 +3092,16 @@ class MainIndex:
         # Populate cache
         _ = self.opcodes_by_name()
         _ = self.installed_dlls()
-        pickle.dump(self, open(outfile, 'wb'))
+        # Installed manifests can change between sessions, do not persist them.
+        # Parsed manpages are validated against their files by _manpage_parse_cached,
+        # a persisted copy would bypass that check
+        self._cache.pop('manifests_by_name', None)
+        self._cache.pop('manpages', None)
+        self._manifests_state = self._manifests_with_mtimes()
+        self._plugin_manifests_state = self._plugin_manifests_with_mtimes()
+        with open(outfile, 'wb') as f:
+            f.write(_MAININDEX_PICKLE_HEADER)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def install_plugin(self, plugin: Plugin, check=False) -> ErrorMsg | None:
         """
@@ -2289,19 +3139,20 @@ class MainIndex:
         installpath.mkdir(parents=True, exist_ok=True)
         _debug("User plugins path: ", installpath.as_posix())
         _debug("Downloaded dll for plugin: ", plugin_binary_path.as_posix())
+        installed_path = installpath / plugin_binary_path.name
         try:
-            shutil.copy(plugin_binary_path.as_posix(), installpath.as_posix())
+            _install_file(plugin_binary_path, installed_path)
         except IOError as e:
             _debug(f"Tried to copy {plugin_binary_path.as_posix()} to {installpath.as_posix()} but failed")
             _debug(str(e))
             return ErrorMsg("Could not copy the binary to the install path")
 
-        installed_path = installpath / plugin_binary_path.name
         if not installed_path.exists():
             return ErrorMsg(f"Installation of plugin {plugin.name} failed, binary was not found in "
                             f"the expected path: {installed_path.as_posix()}")
 
         _session.cache.clear()
+        _session.dlls_cache.invalidate(installpath.as_posix())
 
         # installation succeeded, check that it works
         if not self.is_plugin_installed(plugin, check=check):
@@ -2349,6 +3200,7 @@ class MainIndex:
 
         with open(manifest_path.as_posix(), "w") as f:
             f.write(manifest_json)
+        self._invalidate_installed_state()
         _debug(f"Saved manifest for plugin {plugin.name} to {manifest_path}")
 
         # no errors
@@ -2405,8 +3257,13 @@ class MainIndex:
         """
         Print a list of the installed plugins
         """
-        width, height = _termsize()
-        descr_max_width = width - 36
+        if oneline:
+            width, height = _termsize()
+            descr_max_width = width - 36
+        else:
+            descr_max_width = 0
+
+        extra_lines_prefix = " " * leftcolwidth + "   |   "
 
         if upgradeable:
             installed = True
@@ -2414,9 +3271,12 @@ class MainIndex:
         platform = _session.platformid
         csoundversion = _session.csound_version
 
+        lines: list[str] = []
+        _ = lines.append
+
         if header:
-            print(f"Csound Version: {csoundversion}")
-            print()
+            _(f"Csound Version: {csoundversion}")
+            _("")
 
         for plugin in self.plugins.values():
             data = []
@@ -2431,7 +3291,7 @@ class MainIndex:
                 continue
 
             if nameonly:
-                print(plugin.name)
+                _(plugin.name)
                 continue
 
             extra_lines = []
@@ -2459,11 +3319,11 @@ class MainIndex:
             if oneline and len(descr) > descr_max_width:
                 descr = descr[:descr_max_width] + "…"
             symbol = "*" if plugininstalled else "-"
-            print(f"{symbol} {leftcol.ljust(leftcolwidth)} | {descr} {status}")
-            if extra_lines:
-                for line in extra_lines:
-                    print(" " * leftcolwidth + f"   |   ", line)
-        print()
+            _(f"{symbol} {leftcol.ljust(leftcolwidth)} | {descr} {status}")
+            for line in extra_lines:
+                _(f"{extra_lines_prefix} {line}")
+        _("")
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
 
     def show_plugin(self, pluginname: str) -> bool:
@@ -2477,42 +3337,45 @@ class MainIndex:
             _errormsg(f"Plugin '{pluginname}' unknown\n"
                       f"Known plugins: {', '.join(self.plugins.keys())}")
             return False
+        import textwrap
         info = self.installed_plugin_info(plugdef)
-        print("\n"
-              f"Plugin        : {plugdef.name}    \n"
-              f"Author        : {plugdef.author} ({plugdef.email}) \n"
-              f"URL           : {plugdef.url}     \n"
-              f"Version       : {plugdef.version} \n"
-              )
+        lines: list[str] = []
+        _ = lines.append
+        _("\n"
+          f"Plugin        : {plugdef.name}    \n"
+          f"Author        : {plugdef.author} ({plugdef.email}) \n"
+          f"URL           : {plugdef.url}     \n"
+          f"Version       : {plugdef.version} \n"
+          )
         if info:
             manifest = (info.installed_manifest_path.as_posix() if info.installed_manifest_path
                         else 'No manifest (installed manually)')
-            print(f"Installed     : {info.versionstr} (path: {info.dllpath.as_posix()}) \n"
-                  f"Manifest      : {manifest}")
-        print(f"Abstract      : {plugdef.short_description}")
+            _(f"Installed     : {info.versionstr} (path: {info.dllpath.as_posix()}) \n"
+              f"Manifest      : {manifest}")
+        _(f"Abstract      : {plugdef.short_description}")
         if plugdef.long_description.strip():
-            print("Description:")
-            for line in textwrap.wrap(plugdef.long_description, 72):
-                print(" " * 3, line)
-            # print(textwrap.wrapindent("     ", plugdef.long_description))
-        print(f"Opcodes:")
-        opcstrs = textwrap.wrap(", ".join(plugdef.opcodes), 72)
+            _("Description:")
+            for line in textwrap.wrap(plugdef.long_description, 72, break_on_hyphens=False):
+                _(f"    {line}")
+        _("Opcodes:")
+        opcstrs = textwrap.wrap(", ".join(plugdef.opcodes), 72, break_on_hyphens=False, break_long_words=False)
         for s in opcstrs:
-            print("   ", s)
+            _(f"    {s}")
 
         if plugdef.binaries:
-            print("Binaries:")
+            _("Binaries:")
             for binary in plugdef.binaries:
-                print(f"    * {binary.platform}/csound{binary.csound_version}")
+                _(f"    * {binary.platform}/csound{binary.csound_version}")
 
         if plugdef.assets:
-            print("Assets:")
+            _("Assets:")
             for asset in plugdef.assets:
-                print(f"    * identifier: {_abbrev(asset.identifier(), 70)}\n"
-                      f"      source: {asset.source}\n"
-                      f"      patterns: {', '.join(asset.patterns)}\n"
-                      f"      platform: {asset.platform}")
-        print()
+                _(f"    * identifier: {_abbrev(asset.identifier(), 70)}\n"
+                  f"      source: {asset.source}\n"
+                  f"      patterns: {', '.join(asset.patterns)}\n"
+                  f"      platform: {asset.platform}")
+        _("")
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
 
     def uninstall_plugin(self, plugin: Plugin, removeassets=True) -> None:
@@ -2533,14 +3396,18 @@ class MainIndex:
         info = self.installed_plugin_info(plugin)
         if not info:
             raise RuntimeError(f"Plugin {plugin.name} is not installed")
-        if not info.dllpath.exists():
-            raise RuntimeError(f"Could not find binary for plugin {plugin.name}. "
-                               f"Declared binary: {info.dllpath.as_posix()}")
+        dll = info.dllpath
+        dllstr = dll.as_posix()
         if info.installed_in_system_folder:
             raise RuntimeError(f"Plugin is installed in the system folder and needs to"
-                               f" be removed manually. Path: {info.dllpath.as_posix()}")
-        os.remove(info.dllpath.as_posix())
-        assert not info.dllpath.exists(), f"Attempted to remove {info.dllpath.as_posix()}, but failed"
+                               f" be removed manually. Path: {dllstr}")
+        try:
+            os.remove(dllstr)
+        except FileNotFoundError:
+            raise RuntimeError(f"Could not find binary for plugin {plugin.name}. "
+                               f"Declared binary: {dllstr}")
+        _session.cache.clear()
+        _session.dlls_cache.invalidate(dll.parent.as_posix())
         manifestpath = info.installed_manifest_path
         assetsfolder = RISSET_ASSETS_PATH / plugin.name
         if manifestpath and manifestpath.exists():
@@ -2549,16 +3416,19 @@ class MainIndex:
             if removeassets and assetsfolder.exists():
                 _debug(f"Removing assets for plugin {plugin.name}: {assetfiles}")
                 for assetfile in assetfiles:
-                    assetfullpath = assetsfolder / assetfile
-                    if assetfullpath.exists():
-                        os.remove(assetfullpath)
-                remainingassets = list(assetsfolder.glob("*"))
+                    try:
+                        os.remove(assetsfolder / assetfile)
+                    except FileNotFoundError:
+                        pass
+                with os.scandir(assetsfolder) as it:
+                    remainingassets = [entry.path for entry in it]
                 if remainingassets:
                     _info(f"There are remaining assets in the folder {assetsfolder}: "
-                          f"{', '.join(p.as_posix() for p in remainingassets)}")
+                          f"{', '.join(remainingassets)}")
                     _info("... They will be removed")
                 _rm_dir(assetsfolder)
             os.remove(manifestpath.as_posix())
+        self._invalidate_installed_state()
 
     def install_asset(self, asset: Asset, prefix: str) -> list[str]:
         """
@@ -2583,12 +3453,19 @@ class MainIndex:
                 shutil.copy(source, destination_folder)
         return [f.name for f in sources]
 
-    def generate_opcodes_xml(self) -> str:
+    def generate_opcodes_xml(self, out: TextIO | None = None) -> str | None:
         """
         Generates xml following the scheme of the manual's opcodes.xml
 
         This can be used by frontends to generate help for all csound opcodes
 
+        Args:
+            out: if given, an open text stream to write the xml to. Otherwise
+                the xml is returned as a string
+
+        Returns:
+            the generated xml, or None if it was written to *out*
+
         <?xml version="1.0" encoding="UTF-8"?>
         <opcodes>
           <category name="Orchestra Syntax:Header">
@@ -2609,41 +3486,41 @@ class MainIndex:
           ...
         </opcodes>
         """
-        lines = []
-        indentwidth = 2
-
-        def _(s, indent=0):
-            if indent > 0:
-                s = (" "*(indent*indentwidth)) + s
-            lines.append(s)
+        buf = io.StringIO() if out is None else out
+        w = buf.write
+        ind1, ind2, ind3 = "  ", "    ", "      "
 
-        _('<?xml version="1.0" encoding="UTF-8"?>')
-        _('<opcodes>')
+        w('<?xml version="1.0" encoding="UTF-8"?>\n')
+        w('<opcodes>\n')
         # For now, gather all opcodes belonging to one plugin under the same category. Later we can
         # enforce that each plugin defines a category in their manpage
         opcodes = self.opcodes_by_name()
         for plugin in self.plugins.values():
-            _(f'<category name="External Plugin:{plugin.name}">', 1)
+            w(f'{ind1}<category name="External Plugin:{plugin.name}">\n')
             for opcodename in plugin.opcodes:
                 opcode = opcodes.get(opcodename)
                 if not opcode:
                     continue
-                manpage = self.parse_manpage(opcodename)
+                manpage = self.parse_manpage(opcodename, plugin=plugin)
                 if not manpage:
                     _errormsg(f"No manpage found for opcode {opcodename}, skipping")
                     continue
-                _(f'<opcode name="{opcodename}">', 2)
-                _(f"<desc>{manpage.abstract}</desc>", 3)
+                w(f'{ind2}<opcode name="{opcodename}">\n')
+                w(f"{ind3}<desc>{manpage.abstract}</desc>\n")
                 if not manpage.syntaxes:
                     _errormsg(f"No syntaxes found for opcode {opcodename}, skipping")
                     continue
+                opcodetag = f"<opcodename>{opcodename}</opcodename>"
+                opcodelen = len(opcodename)
                 for syntax in manpage.syntaxes:
-                    syntax = syntax.replace(opcodename, f"<opcodename>{opcodename}</opcodename>")
-                    _(f"<synopsis>{syntax}</synopsis>", 3)
-                _("</opcode>", 2)
-            _('</category>', 1)
-        _('</opcodes>')
-        return "\n".join(lines)
+                    # Only the first occurrence is the opcode itself
+                    if (idx := syntax.find(opcodename)) >= 0:
+                        syntax = syntax[:idx] + opcodetag + syntax[idx+opcodelen:]
+                    w(f"{ind3}<synopsis>{syntax}</synopsis>\n")
+                w(f"{ind2}</opcode>\n")
+            w(f'{ind1}</category>\n')
+        w('</opcodes>')
+        return buf.getvalue() if out is None else None
 
 
 ###############################################################
@@ -2657,11 +3534,8 @@ def _is_package_installed(pkg: str) -> bool:
 
 
 def _call_mkdocs(folder: Path, *args: str) -> None:
-    currentdir = os.getcwd()
-    os.chdir(folder)
-    _debug(f"Rendering docs via mkdocs. Current dir: {os.getcwd()}")
-    _subproc_call([sys.executable, "-m", "mkdocs"] + list(args))
-    os.chdir(currentdir)
+    _debug(f"Rendering docs via mkdocs. Working dir: {folder}")
+    _subproc_call([sys.executable, "-m", "mkdocs", *args], cwd=folder)
 
 
 def _is_mkdocs_installed() -> bool:
@@ -2693,8 +3567,8 @@ def _generate_documentation(index: MainIndex,
                   onlyinstalled=onlyinstalled)
 
     if opcodesxml:
-        xmlstr = index.generate_opcodes_xml()
-        open(opcodesxml, "w").write(xmlstr)
+        with open(opcodesxml, "w") as f:
+            index.generate_opcodes_xml(out=f)
 
     if buildhtml:
         mkdocsconfig = RISSET_DATAREPO_LOCALPATH / "assets" / "mkdocs.yml"
@@ -2762,63 +3636,98 @@ def _compile_docs(index: MainIndex, dest: Path, makeindex=True,
         _docs_generate_index(index, dest / "index.md")
 
 
-def _manpage_parse(manpage: Path, opcode: str) -> ManPage | None:
+_RE_SYNTAX_HEADER = re.compile(r"^[^\S\n]*#+[^\S\n]+[sS]yntax[^\S\n]*$", re.MULTILINE)
+_RE_SECTION_START = re.compile(r"^\s*[#!;/]")
+_RE_SYNTAX_PREFIX = re.compile(r"^\s*[akigS\[x]")
+
+
+def _first_paragraph_line(lines: Iterable[str]) -> str:
+    """
+    Returns the first non-empty line, or an empty string if that line is a header
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            return line if not line.startswith("#") else ""
+    return ""
+
+
+def _manpage_parse(manpage: Path, opcode: str, text: str | None = None) -> ManPage | None:
+    """
+    Parse the manpage of an opcode
+
+    Args:
+        manpage: the path to the markdown manpage
+        opcode: the opcode documented by this manpage
+        text: the contents of the manpage, if already read
+
+    Returns:
+        the parsed ManPage, or None if no manpage was given
+    """
     if not manpage:
         _errormsg(f"Opcode {opcode} has no manpage")
         return None
 
-    text = open(manpage).read()
-    lines = text.splitlines()
-    it = iter(lines)
-    abstract = ''
+    if text is None:
+        text = Path(manpage).read_text()
     syntaxlines = []
-    foundsyntaxtag = False
-    for line in it:
-        if re.search(r"^\s*#+\s+[s|S]yntax\s*$", line):
-            foundsyntaxtag = True
-            break
-    if foundsyntaxtag:
-        for line in it:
-            if re.search(r"^\s*[#!;/]", line):
+    if (match := _RE_SYNTAX_HEADER.search(text)) is not None:
+        # The syntax section ends at the next header or comment line
+        for line in text[match.end():].splitlines():
+            if _RE_SECTION_START.match(line):
                 break
-            elif opcode in line and (re.search(r"^\s*[akigS\[x]", line) or line.lstrip().startswith(opcode)):
+            elif opcode in line and (_RE_SYNTAX_PREFIX.match(line) or line.lstrip().startswith(opcode)):
                 syntax = line.strip().split(";", maxsplit=1)[0]
                 syntaxlines.append(syntax)
 
-    if "# Abstract" in text:
-        # the abstract would be all the text between # Abstract and the next #tag
-        it = iter(lines)
-        for line in it:
-            if "# Abstract" in line:
-                break
-        for line in it:
-            line = line.strip()
-            if not line:
-                continue
-            abstract = line if not line.startswith("#") else ""
-            break
-        else:
+    if (abstractidx := text.find("# Abstract")) >= 0:
+        # the abstract would be the first paragraph line after the # Abstract tag
+        abstract = _first_paragraph_line(text[abstractidx:].splitlines()[1:])
+        if not abstract:
             _debug(f"No abstract in manpage file {manpage}")
     else:
         # no Abstract tag, so abstract is the text between the title and the text tag
         _debug(f"get_abstract: manpage for opcode {opcode} has no # Abstract tag")
-        it = iter(lines)
+        it = iter(text.splitlines())
         for line in it:
             line = line.strip()
             if line:
-                if line.startswith("#") and line.split("")[-1] == opcode:
+                if line.startswith("#") and line.split()[-1] == opcode:
                     break
                 else:
                     raise ParseError(f"Expected title, got {line}")
-        for line in it:
-            line = line.strip()
-            if line:
-                abstract = line if not line.startswith("#") else ""
-                break
+        abstract = _first_paragraph_line(it)
 
     return ManPage(syntaxes=syntaxlines, abstract=abstract)
 
 
+def _manpage_parse_cached(manpage: Path, opcode: str) -> ManPage | None:
+    """
+    Like _manpage_parse, but cached across sessions
+
+    A cached result is valid as long as the mtime and size of the manpage
+    do not change. Otherwise, the content hash is compared before parsing
+    the manpage again (a git checkout, for example, modifies the mtime of
+    files which did not change)
+    """
+    import hashlib
+    st = manpage.stat()
+    key = f"{opcode}:{manpage.as_posix()}"
+    cached = _session.manpages_cache.get(key)
+    if cached is not None and len(cached) == 4:
+        mtime, size, digest, out = cached
+        if mtime == st.st_mtime_ns and size == st.st_size:
+            return out
+    else:
+        digest, out = b'', None
+    data = manpage.read_bytes()
+    newdigest = hashlib.blake2b(data, digest_size=8).digest()
+    if newdigest != digest:
+        out = _manpage_parse(manpage, opcode, text=data.decode())
+    _session.manpages_cache.set(key, (st.st_mtime_ns, st.st_size, newdigest, out))
+    return out
+
+
 def _docs_generate_index(index: MainIndex, outfile: Path) -> None:
     """
     Generate an index for the documentation
@@ -2830,18 +3739,19 @@ def _docs_generate_index(index: MainIndex, outfile: Path) -> None:
     lines: list[str] = []
     _ = lines.append
     _("# Plugins\n")
-    plugins = sorted(index.plugins.values(), key=lambda plugin: plugin.name)
+    plugins = index.sorted_plugins()
+    index.prefetch_manpages([(opcode, plugin) for plugin in plugins for opcode in plugin.opcodes])
     for plugin in plugins:
         _(f"## {plugin.name}\n")
         _(plugin.short_description + '\n')
-        opcodes = sorted(plugin.opcodes)
-        for opcode in opcodes:
-            manpage = plugin.manpage(opcode)
-            if not manpage:
-                _debug(f"opcode {opcode} has no manpage")
+        # opcodes are sorted when the plugin definition is parsed
+        for opcode in plugin.opcodes:
+            parsedmanpage = index.parse_manpage(opcode, plugin=plugin)
+            if not parsedmanpage:
+                if _session.debug:
+                    _debug(f"opcode {opcode} has no manpage")
                 continue
-            parsedmanpage = _manpage_parse(manpage, opcode)
-            if not parsedmanpage or not parsedmanpage.abstract:
+            if not parsedmanpage.abstract:
                 _errormsg(f"Could not get abstract for opcode {opcode}")
                 continue
             _(f"  * [{opcode}](opcodes/{opcode}.md): {parsedmanpage.abstract}")
@@ -2920,12 +3830,11 @@ def cmd_install(index: MainIndex, args) -> str:
     Args:
         plugin   - name of the plugin to install
     """
+    import fnmatch
     allplugins: list[Plugin] = []
+    pluginnames = list(index.plugins.keys())
     for pattern in args.plugins:
-        matched = [plugin for name, plugin in index.plugins.items()
-                   if fnmatch.fnmatch(name, pattern)]
-        if matched:
-            allplugins.extend(matched)
+        allplugins.extend(index.plugins[name] for name in fnmatch.filter(pluginnames, pattern))
     if not allplugins:
         return "No plugins matched"
 
@@ -2989,9 +3898,11 @@ def cmd_man(idx: MainIndex, args) -> str:
         fmt = "html"
     else:
         fmt = "markdown"
+    import fnmatch
+    definedopcodes = idx.opcodes_by_name()
+    opcodenames = list(definedopcodes.keys())
     for pattern in args.opcode:
-        opcodes.extend(opcode for opcode in idx.defined_opcodes()
-                       if fnmatch.fnmatch(opcode.name, pattern))
+        opcodes.extend(definedopcodes[name] for name in fnmatch.filter(opcodenames, pattern))
     if not opcodes:
         # open the index
         htmlidx = RISSET_GENERATED_DOCS / "site" / "index.html"
@@ -3022,10 +3933,13 @@ def cmd_man(idx: MainIndex, args) -> str:
 
 
 def cmd_resetcache(args) -> str:
+    _session.cache.pop('mainindex', None)
     _rm_dir(RISSET_DATAREPO_LOCALPATH)
     _rm_dir(RISSET_CLONES_PATH)
-    if os.path.exists(_MAININDEX_PICKLE_FILE):
-        os.remove(_MAININDEX_PICKLE_FILE)
+    for cachefile in (_MAININDEX_PICKLE_FILE, _DLLS_CACHE_FILE, _PLUGINS_CACHE_FILE, _MANPAGES_CACHE_FILE,
+                      _DOWNLOADS_CACHE_FILE):
+        if os.path.exists(cachefile):
+            os.remove(cachefile)
     return ''
 
 def update_self():
@@ -3049,15 +3963,28 @@ def cmd_list_installed_opcodes(plugins_index: MainIndex, args) -> str:
 
 
 def cmd_dev(idx: MainIndex, args) -> str:
-    if args.cmd == 'opcodesxml':
-        outstr = idx.generate_opcodes_xml()
-        outfile = args.outfile or RISSET_OPCODESXML
+    if not args.rest:
+        return "No dev command given. Possible commands: opcodesxml, codesign"
+    devcmd, *options = args.rest
+    # Options given after the subcommand, like 'risset dev opcodesxml --outfile=FILE'
+    import argparse
+    optparser = argparse.ArgumentParser(prog=f"risset dev {devcmd}", add_help=False)
+    optparser.add_argument("--outfile", default=args.outfile)
+    opts, unknown = optparser.parse_known_args(options)
+    if unknown:
+        return f"Invalid arguments for dev command '{devcmd}': {unknown}"
+    outfile = opts.outfile
+
+    if devcmd == 'opcodesxml':
+        outfile = outfile or RISSET_OPCODESXML
         if outfile == 'stdout':
-            print(outstr)
+            idx.generate_opcodes_xml(out=sys.stdout)
+            sys.stdout.write("\n")
         else:
-            open(outfile, "w").write(outstr)
+            with open(outfile, "w") as f:
+                idx.generate_opcodes_xml(out=f)
             _debug(f"Generated opcodes.xml at '{outfile}'")
-    elif args.cmd == 'codesign':
+    elif devcmd == 'codesign':
         if _session.platform != 'macos':
             return f"Code signing is only available for macos, not for '{_session.platform}'"
 
@@ -3073,6 +4000,8 @@ def cmd_dev(idx: MainIndex, args) -> str:
         else:
             _debug(f"Code signing the following plugin binaries: {dylibs}")
             macos_codesign(dylibs)
+    else:
+        return f"Unknown dev command '{devcmd}'. Possible commands: opcodesxml, codesign"
 
     return ''
 
@@ -3110,7 +4039,7 @@ def cmd_info(idx: MainIndex, args) -> str:
 
 
     d = {
-        'version': importlib.metadata.version("risset"),
+        'version': _risset_version(),
         'index-version': idx.version,
         'pluginspath': idx.user_plugins_path.as_posix(),
         'rissetroot': RISSET_ROOT.as_posix(),
@@ -3128,7 +4057,7 @@ def cmd_info(idx: MainIndex, args) -> str:
         d['plugins'] = idx.list_plugins_as_dict()
     jsonstr = json.dumps(d, indent=True)
     if args.outfile:
-        open(args.outfile, "w").write(jsonstr)
+        Path(args.outfile).write_text(jsonstr)
     else:
         print(jsonstr)
     return ''
@@ -3200,8 +4129,7 @@ def validate_definition(infile: str) -> str:
     if not os.path.exists(infile):
         return f"validate: file {infile} not found"
     try:
-        jsonstr = open(infile).read()
-        root = json.loads(jsonstr)
+        root = _load_json(infile)
     except json.JSONDecodeError as e:
         return f"validate: Error decoding json file '{infile}': {e}"
 
@@ -3268,7 +4196,7 @@ def validate_definition(infile: str) -> str:
     return '; '.join(allerrors) if allerrors else ''
 
 
-def cmd_validate(idx: MainIndex, args) -> str:
+def cmd_validate(idx: MainIndex | None, args) -> str:
     """Validate a definition file"""
     return validate_definition(args.infile)
 
@@ -3278,7 +4206,7 @@ def _running_from_terminal() -> bool:
 
 
 def _print_file(path: Path) -> None:
-    text = open(str(path)).read()
+    text = Path(path).read_text()
     print(text)
 
 
@@ -3292,7 +4220,7 @@ def _show_markdown_file(path: Path, style='dark') -> None:
     from pygments.formatters import TerminalTrueColorFormatter
     from pygments.styles import STYLE_MAP
     # from pygments.formatters import TerminalFormatter
-    code = open(path).read()
+    code = Path(path).read_text()
     if style == 'dark':
         style = 'fruity'
     elif style == 'light':
@@ -3305,71 +4233,49 @@ def _show_markdown_file(path: Path, style='dark') -> None:
     # print(highlight(code, MarkdownLexer(), TerminalFormatter()))
 
 
-def main():
-    # Preliminary checks
-    if sys.platform not in ("linux", "darwin", "win32"):
-        _errormsg(f"Platform not supported: {sys.platform}")
-        sys.exit(-1)
-
-    if _get_git_binary() is None:
-        _errormsg("git command not found. Check that git is installed and in the PATH")
-        sys.exit(-1)
-
-    def flag(parser, flag, help=""):
-        parser.add_argument(flag, action="store_true", help=help)
-
-    # Main parser
-    parser = argparse.ArgumentParser()
-    flag(parser, "--debug", help="Print debug information")
-    flag(parser, "--update", help="Update the plugins data before any action")
-    flag(parser, "--stoponerror", help="Stop parsing if an error is detected")
-    flag(parser, "--version", help="Print version and exit")
-    parser.add_argument("-c", "--csound", default=0, type=int,
-                        help="Which csound version to use (one of 0, 6, 7). "
-                             "Use 0 to detect the installed version")
+def _flag(parser, flag, help=""):
+    parser.add_argument(flag, action="store_true", help=help)
 
-    subparsers = parser.add_subparsers(dest='command')
 
-    # List command
+def _add_list_cmd(subparsers) -> None:
     list_cmd = subparsers.add_parser('list', help="List packages")
-
-    flag(list_cmd, "--json", help="Outputs list as json")
-    flag(list_cmd, "--nameonly", help="Output just the name of each plugin")
-    flag(list_cmd, "--installed", help="List only installed plugins")
-    flag(list_cmd, "--upgradeable", help="List only installed packages which can be upgraded")
-    flag(list_cmd, "--notinstalled", help="List only plugins which are not installed")
-    flag(list_cmd, "--noheader", help="Do not print any extra information")
+    _flag(list_cmd, "--json", help="Outputs list as json")
+    _flag(list_cmd, "--nameonly", help="Output just the name of each plugin")
+    _flag(list_cmd, "--installed", help="List only installed plugins")
+    _flag(list_cmd, "--upgradeable", help="List only installed packages which can be upgraded")
+    _flag(list_cmd, "--notinstalled", help="List only plugins which are not installed")
+    _flag(list_cmd, "--noheader", help="Do not print any extra information")
     list_cmd.add_argument("-o", "--outfile", help="Outputs to a file")
     list_cmd.add_argument("-1", "--oneline", action="store_true", help="List each plugin in one line")
-    list_cmd.set_defaults(func=cmd_list)
 
-    # Install command
+
+def _add_install_cmd(subparsers) -> None:
     install_cmd = subparsers.add_parser("install", help="Install or update a package")
-    flag(install_cmd, "--force", help="Force install/reinstall")
+    _flag(install_cmd, "--force", help="Force install/reinstall")
     install_cmd.add_argument("plugins", nargs="+",
                              help="Name of the plugin/plugins to install. "
                                   "Glob pattern are supported (enclose them inside quotation marks)")
-    install_cmd.set_defaults(func=cmd_install)
 
-    # remove command
+
+def _add_remove_cmd(subparsers) -> None:
     rm_cmd = subparsers.add_parser("remove", help="Remove a package")
     rm_cmd.add_argument("plugin", nargs="+", help="Plugin/s to remove")
-    rm_cmd.set_defaults(func=cmd_rm)
 
-    # show command
+
+def _add_show_cmd(subparsers) -> None:
     show_cmd = subparsers.add_parser("show", help="Show information about a plugin")
     show_cmd.add_argument("plugin", help="Plugin to gather information about")
-    show_cmd.set_defaults(func=cmd_show)
 
-    # build docs
+
+def _add_makedocs_cmd(subparsers) -> None:
     makedocs_cmd = subparsers.add_parser("makedocs", help="Build the documentation for all defined plugins. "
                                                           "This depends on mkdocs being installed")
     makedocs_cmd.add_argument("--onlyinstalled", action="store_true", help="Build docs only for installed plugins")
     makedocs_cmd.add_argument("-o", "--outfolder", help="Destination folder to place the documentation",
                               default='')
-    makedocs_cmd.set_defaults(func=cmd_makedocs)
 
-    # man command
+
+def _add_man_cmd(subparsers) -> None:
     man_cmd = subparsers.add_parser("man", help="Open manual page for an installed opcode. "
                                                 "Multiple opcodes or a glob wildcard are allowed")
     man_cmd.add_argument("-p", "--path", action="store_true",
@@ -3392,67 +4298,222 @@ def main():
                          help="Show the manual page of this opcode/opcodes. Multiple opcodes "
                               "can be given and each entry can be also a glob pattern (make sure to "
                               "enclose it in quotation marks)")
-    man_cmd.set_defaults(func=cmd_man)
 
-    # update command
-    update_cmd = subparsers.add_parser("update", help="Update repository. Updates the metadata about available"
-                                                      "packages, their versions, etc.")
 
-    # list-opcodes
+def _add_update_cmd(subparsers) -> None:
+    subparsers.add_parser("update", help="Update repository. Updates the metadata about available"
+                                         "packages, their versions, etc.")
+
+
+def _add_listopcodes_cmd(subparsers) -> None:
     listopcodes_cmd = subparsers.add_parser("listopcodes", help="List installed opcodes")
     listopcodes_cmd.add_argument("-l", "--long", action="store_true", help="Long format")
-    listopcodes_cmd.set_defaults(func=cmd_list_installed_opcodes)
 
-    # reset
-    reset_cmd = subparsers.add_parser("resetcache", help="Remove local clones of plugin's repositories")
 
-    # info
+def _add_resetcache_cmd(subparsers) -> None:
+    subparsers.add_parser("resetcache", help="Remove local clones of plugin's repositories")
+
+
+def _add_info_cmd(subparsers) -> None:
     info_cmd = subparsers.add_parser("info", help="Outputs information about risset itself in json format")
     info_cmd.add_argument("--outfile", default=None, help="Save output to this path")
     info_cmd.add_argument("--full", action="store_true", help="Include all available information")
-    info_cmd.set_defaults(func=cmd_info)
 
-    # upgrade
-    upgrade_cmd = subparsers.add_parser("upgrade", help="Upgrade any installed plugin to a new version, if there"
-                                                        "is one")
-    upgrade_cmd.set_defaults(func=cmd_upgrade)
 
-    # download
+def _add_upgrade_cmd(subparsers) -> None:
+    subparsers.add_parser("upgrade", help="Upgrade any installed plugin to a new version, if there"
+                                          "is one")
+
+
+def _add_download_cmd(subparsers) -> None:
     download_cmd = subparsers.add_parser('download', help='Download a plugin')
     download_cmd.add_argument('--path', help='Directory to download the plugin to (default: current directory)')
     download_cmd.add_argument('--platform', help='The platform of the plugin to download (default: current platform)',
                               choices=['linux', 'macos', 'window', 'macos-arm64', 'linux-arm64'])
     download_cmd.add_argument('plugin', help='The name of the plugin to download')
-    download_cmd.set_defaults(func=cmd_download)
 
-    # validate
+
+def _add_validate_cmd(subparsers) -> None:
     validate_cmd = subparsers.add_parser("validate", help="Validate a risset.json definition")
     validate_cmd.add_argument('infile', help="File to validate. By default, a risset.json definition")
-    validate_cmd.set_defaults(func=cmd_validate)
+    validate_cmd.set_defaults(needs_index=False)
+
 
+def _add_dev_cmd(subparsers) -> None:
     # dev: risset dev opcodesxml
     #      risset dev codesign
     dev_cmd = subparsers.add_parser("dev", help="Commands for developer use")
-
     dev_cmd.add_argument("--outfile", default=None,
                          help="Set the output file for any action generating output")
-    dev_cmd.add_argument("cmd", choices=["opcodesxml", "codesign"],
-                         help="Subcommand. opcodesxml: generate xml output similar to "
+    import argparse
+    dev_cmd.add_argument("rest", nargs=argparse.REMAINDER,
+                         help="Subcommand and its arguments. opcodesxml: generate xml output similar to "
                               "opcodes.xml in the csound's manual; "
                               "codesign: code sign all installed plugins (macos only)")
-    dev_cmd.set_defaults(func=cmd_dev)
 
 
+_SHORT_USAGE = """\
+usage: risset [-h] [--debug] [--update] [--stoponerror] [--version] [-c CSOUND] <command> ...
+
+commands: list, install, remove, show, makedocs, man, update, listopcodes,
+          resetcache, info, upgrade, download, validate, dev
+
+Use 'risset -h' for more information, or 'risset <command> -h' for help about a command
+"""
+
+
+# command name -> function adding its subparser. The order determines the
+# order in which commands are listed in the help
+_COMMANDS = {
+    'list': _add_list_cmd,
+    'install': _add_install_cmd,
+    'remove': _add_remove_cmd,
+    'show': _add_show_cmd,
+    'makedocs': _add_makedocs_cmd,
+    'man': _add_man_cmd,
+    'update': _add_update_cmd,
+    'listopcodes': _add_listopcodes_cmd,
+    'resetcache': _add_resetcache_cmd,
+    'info': _add_info_cmd,
+    'upgrade': _add_upgrade_cmd,
+    'download': _add_download_cmd,
+    'validate': _add_validate_cmd,
+    'dev': _add_dev_cmd,
+}
+
+
+# command name -> handler, called as handler(mainindex, args). update and
+# resetcache are handled within main
+_HANDLERS = {
+    'list': cmd_list,
+    'install': cmd_install,
+    'remove': cmd_rm,
+    'show': cmd_show,
+    'makedocs': cmd_makedocs,
+    'man': cmd_man,
+    'listopcodes': cmd_list_installed_opcodes,
+    'info': cmd_info,
+    'upgrade': cmd_upgrade,
+    'download': cmd_download,
+    'validate': cmd_validate,
+    'dev': cmd_dev,
+}
+
+
+def _detect_command(argv: list[str]) -> str | None:
+    """
+    Find the subcommand within the command line arguments, without parsing them
+
+    Args:
+        argv: the command line arguments, without the program name
+
+    Returns:
+        the name of the subcommand, or None if no subcommand was found or
+        help was requested before any subcommand
+    """
+    skipnext = False
+    for arg in argv:
+        if skipnext:
+            skipnext = False
+        elif arg in ('-h', '--help'):
+            return None
+        elif arg in ('-c', '--csound'):
+            # -c takes a value
+            skipnext = True
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the command line parser
+
+    Args:
+        command: if given, only the subparser for this command is built.
+            Otherwise all subparsers are added
+
+    Returns:
+        the argument parser
+    """
+    import argparse
+    parser = argparse.ArgumentParser()
+    _flag(parser, "--debug", help="Print debug information")
+    _flag(parser, "--update", help="Update the plugins data before any action")
+    _flag(parser, "--stoponerror", help="Stop parsing if an error is detected")
+    _flag(parser, "--version", help="Print version and exit")
+    parser.add_argument("-c", "--csound", default=0, type=int,
+                        help="Which csound version to use (one of 0, 6, 7). "
+                             "Use 0 to detect the installed version")
+
+    subparsers = parser.add_subparsers(dest='command')
+    # Only build the subparser for the command being called. The full set is
+    # only needed for printing help or reporting an unknown command
+    if command in _COMMANDS:
+        _COMMANDS[command](subparsers)
+    else:
+        for addcmd in _COMMANDS.values():
+            addcmd(subparsers)
+    return parser
+
+
+def _start_profiling(numlines=25) -> None:
+    """
+    Profile the rest of the process, print the stats at exit
+
+    Args:
+        numlines: number of entries to print, sorted by cumulative time
+    """
+    import cProfile
+    import pstats
+    profiler = cProfile.Profile()
+
+    def report():
+        profiler.disable()
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(numlines)
+
+    atexit.register(report)
+    profiler.enable()
+
+
+def main():
+    if os.environ.get("RISSET_PROFILE"):
+        _start_profiling()
+
+    argv = sys.argv[1:]
+    # Trivial invocations, no need to go through argparse or any checks
+    if argv and argv[0] in ('--version', '-v'):
+        print(_risset_version())
+        sys.exit(0)
+    elif not argv:
+        sys.stderr.write(_SHORT_USAGE)
+        sys.exit(-1)
+    elif argv == ['resetcache']:
+        # Takes no arguments and does not need git or the index
+        cmd_resetcache(None)
+        sys.exit(0)
+
+    # Preliminary checks
+    if sys.platform not in ("linux", "darwin", "win32"):
+        _errormsg(f"Platform not supported: {sys.platform}")
+        sys.exit(-1)
+
+    if _get_git_binary() is None:
+        _errormsg("git command not found. Check that git is installed and in the PATH")
+        sys.exit(-1)
+
+    parser = _build_parser(_detect_command(argv))
     args = parser.parse_args()
-    _session.debug = args.debug
+    debug = args.debug or _session.debug
+    _session.debug = debug
     _session.stop_on_errors = args.stoponerror
 
     if args.version:
-        print(__version__)
+        print(_risset_version())
         sys.exit(0)
 
     if not args.command:
-        parser.print_help()
+        sys.stderr.write(_SHORT_USAGE)
         sys.exit(-1)
     elif args.command == 'resetcache':
         cmd_resetcache(args)
@@ -3460,30 +4521,35 @@ def main():
 
     update = args.update or args.command == 'update'
 
-    if args.csound == 0:
-        csoundversion, minor, rest = _csound_version()
-    else:
-        csoundversion = args.csound
-
-    try:
-        _debug(f"Creating main index - csound major version: {csoundversion}")
-        if not update:
-            mainindex = _mainindex_retrieve() or MainIndex(update=False, majorversion=csoundversion)
+    # Some commands (validate) do not depend on the plugins' state
+    mainindex: MainIndex | None = None
+    if update or getattr(args, 'needs_index', True):
+        if args.csound == 0:
+            csoundversion, minor, rest = _csound_version()
         else:
-            # this will serialize the mainindex
-            mainindex = MainIndex(update=True, majorversion=csoundversion)
-    except Exception as e:
-        _errormsg("Failed to create main index")
-        if _session.debug:
-            raise e
-        else:
-            _errormsg(str(e))
-            sys.exit(-1)
+            csoundversion = args.csound
+
+        try:
+            _debug(f"Creating main index - csound major version: {csoundversion}")
+            if not update:
+                mainindex = _mainindex_retrieve()
+                if mainindex is None or mainindex.majorversion != csoundversion:
+                    mainindex = MainIndex(update=False, majorversion=csoundversion)
+            else:
+                # this will serialize the mainindex
+                mainindex = MainIndex(update=True, majorversion=csoundversion)
+        except Exception as e:
+            _errormsg("Failed to create main index")
+            if debug:
+                raise e
+            else:
+                _errormsg(str(e))
+                sys.exit(-1)
 
     if args.command == 'update':
         sys.exit(0)
     else:
-        errormsg = args.func(mainindex, args)
+        errormsg = _HANDLERS[args.command](mainindex, args)
         if errormsg:
             _errormsg(f"Command {args.command} failed")
             _errormsg(errormsg)
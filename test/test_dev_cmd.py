@@ -0,0 +1,31 @@
+import io
+
+import pytest
+
+import risset
+
+
+class _FakeIndex:
+    def generate_opcodes_xml(self, out: io.TextIOBase) -> None:
+        out.write("<opcodes/>")
+
+
+@pytest.mark.parametrize("outfileargs", [
+    lambda path: ["--outfile", path],
+    lambda path: [f"--outfile={path}"],
+])
+@pytest.mark.parametrize("position", ["before", "after"])
+def test_dev_outfile(tmp_path, outfileargs, position):
+    outfile = (tmp_path / "opcodes.xml").as_posix()
+    if position == "before":
+        argv = ["dev", *outfileargs(outfile), "opcodesxml"]
+    else:
+        argv = ["dev", "opcodesxml", *outfileargs(outfile)]
+    args = risset._build_parser("dev").parse_args(argv)
+    assert risset.cmd_dev(_FakeIndex(), args) == ''
+    assert open(outfile).read() == "<opcodes/>"
+
+
+def test_dev_invalid_arguments():
+    args = risset._build_parser("dev").parse_args(["dev", "opcodesxml", "--foo"])
+    assert "Invalid arguments" in risset.cmd_dev(_FakeIndex(), args)
@@ -0,0 +1,23 @@
+import pickle
+
+import risset
+
+
+def test_roundtrip(tmp_path):
+    path = tmp_path / "cache.pickle"
+    cache = risset._PersistentCache(path)
+    cache.set("key", 1)
+    cache.save()
+    assert risset._PersistentCache(path).get("key") == 1
+
+
+def test_outdated_layout_is_discarded(tmp_path):
+    path = tmp_path / "cache.pickle"
+    # A cache saved without layout information, as older versions did
+    with open(path, "wb") as f:
+        pickle.dump({"key": 1, "other": 2}, f)
+    assert risset._PersistentCache(path).get("key") is None
+    # Same format, other fields
+    with open(path, "wb") as f:
+        pickle.dump(((risset._PERSISTENT_CACHE_FORMAT, ()), {"key": 1}), f)
+    assert risset._PersistentCache(path).get("key") is None
@@ -0,0 +1,18 @@
+import risset
+
+
+def test_does_not_need_libcsound(monkeypatch, tmp_path):
+    def fail():
+        raise ImportError("libcsound not available")
+    monkeypatch.setattr(risset, "_csoundlib_version", fail)
+    monkeypatch.setenv("CS_USER_PLUGINDIR", str(tmp_path))
+    monkeypatch.setenv("OPCODE6DIR64", str(tmp_path / "missing"))
+    risset._session.cache.pop('user_plugins_path_6', None)
+    risset._session.cache.pop('user_plugins_path_7', None)
+    mtimes = risset._plugin_dirs_mtimes()
+    assert tmp_path.stat().st_mtime_ns in mtimes
+    assert 0 in mtimes
+    (tmp_path / "newdir").mkdir()
+    assert risset._plugin_dirs_mtimes() != mtimes
+    risset._session.cache.pop('user_plugins_path_6', None)
+    risset._session.cache.pop('user_plugins_path_7', None)